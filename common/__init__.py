@@ -0,0 +1 @@
+"""Shared helpers used by several days' solutions."""
@@ -0,0 +1,32 @@
+"""Optional NumPy support for solvers that offer a vectorised engine.
+
+NumPy is not a requirement of this repo.  Solvers import `np` from here and
+pass their --engine choice through resolve_engine(): 'auto' picks NumPy when
+it is installed and falls back to the pure Python code otherwise.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ENGINES = ('auto', 'python', 'numpy')
+
+
+def resolve_engine(engine):
+    """Map 'auto' / 'python' / 'numpy' to the engine that will actually run."""
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}, expected one of {', '.join(ENGINES)}")
+    if engine == 'auto':
+        return 'numpy' if np is not None else 'python'
+    if engine == 'numpy' and np is None:
+        raise ImportError("the numpy engine needs NumPy installed (pip install numpy)")
+    return engine
+
+
+def as_int64(values):
+    """View an array('q') column as an int64 ndarray without copying; other sequences are converted."""
+    if isinstance(values, array) and values.typecode == 'q':
+        return np.frombuffer(values, dtype=np.int64)
+    return np.asarray(values, dtype=np.int64)
@@ -0,0 +1,100 @@
+"""Compact character grid backed by a single flat bytearray.
+
+Cells are addressed by a flat index instead of grid[row][col].  The grid is
+surrounded by `pad` rings of a fill byte, so a hot loop can step to a
+neighbour with `index + offset` and test the fill byte instead of doing
+explicit bounds checks.
+"""
+
+
+class Grid:
+    def __init__(self, lines, pad=1, fill='#'):
+        lines = [line for line in lines if line]
+        self.rows = len(lines)
+        self.cols = max((len(line) for line in lines), default=0)
+        self.pad = pad
+        self.fill = ord(fill)
+        self.width = self.cols + 2 * pad
+        self.height = self.rows + 2 * pad
+
+        self.cells = bytearray([self.fill]) * (self.width * self.height)
+        for row, line in enumerate(lines):
+            start = self.index(row, 0)
+            self.cells[start:start + len(line)] = line.encode() if isinstance(line, str) else line
+
+        # Flat-index offsets, clockwise from up
+        self.up = -self.width
+        self.right = 1
+        self.down = self.width
+        self.left = -1
+        self.directions = (self.up, self.right, self.down, self.left)
+        self.diagonals = (self.up + self.left, self.up + self.right,
+                          self.down + self.right, self.down + self.left)
+
+    @classmethod
+    def from_file(cls, filename, pad=1, fill='#'):
+        with open(filename, 'r') as f:
+            return cls(f.read().strip().split('\n'), pad, fill)
+
+    @classmethod
+    def blank(cls, rows, cols, char='.', pad=1, fill='#'):
+        return cls([char * cols] * rows, pad, fill)
+
+    def index(self, row, col):
+        """Flat index of (row, col) in unpadded grid coordinates."""
+        return (row + self.pad) * self.width + col + self.pad
+
+    def position(self, index):
+        """(row, col) in unpadded grid coordinates for a flat index."""
+        row, col = divmod(index, self.width)
+        return row - self.pad, col - self.pad
+
+    def get(self, row, col):
+        return chr(self.cells[self.index(row, col)])
+
+    def set(self, row, col, char):
+        self.cells[self.index(row, col)] = ord(char)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def find(self, char):
+        """Flat index of the first cell holding `char`, or -1."""
+        return self.cells.find(ord(char))
+
+    def find_position(self, char):
+        """(row, col) of the first cell holding `char`, or None."""
+        index = self.find(char)
+        return None if index < 0 else self.position(index)
+
+    def find_all(self, char):
+        """Flat indices of every cell holding `char`."""
+        value = ord(char)
+        indices = []
+        index = self.cells.find(value)
+        while index >= 0:
+            indices.append(index)
+            index = self.cells.find(value, index + 1)
+        return indices
+
+    def interior(self):
+        """Flat indices of every non-padding cell, row by row."""
+        for row in range(self.rows):
+            start = self.index(row, 0)
+            yield from range(start, start + self.cols)
+
+    def row_text(self, row):
+        start = self.index(row, 0)
+        return self.cells[start:start + self.cols].decode()
+
+    def copy(self):
+        other = Grid.__new__(Grid)
+        other.__dict__.update(self.__dict__)
+        other.cells = bytearray(self.cells)
+        return other
+
+    def __len__(self):
+        return self.rows
+
+    def __str__(self):
+        return '\n'.join(self.row_text(row) for row in range(self.rows))
@@ -0,0 +1,63 @@
+"""Bulk integer parsing for the numeric-input days.
+
+The input file is memory-mapped and every byte that cannot be part of an
+integer is translated to a space in one C-level pass, after which a single
+split() yields the tokens.  No per-line str objects are created.  A '-' is
+always read as a sign, which holds for every numeric input in this repo.
+Columns come back as `array('q')` instead of lists of Python ints.
+"""
+import mmap
+from array import array
+from contextlib import contextmanager
+
+# Keep digits and '-', blank out everything else
+INT_BYTES = bytes(byte if byte in b'-0123456789' else ord(' ') for byte in range(256))
+
+
+def int_tokens(data):
+    """Integer tokens (as bytes) in a bytes-like buffer."""
+    # mmap has no translate(); slicing it is a single memcpy
+    return bytes(data[:]).translate(INT_BYTES).split()
+
+
+@contextmanager
+def mapped_file(filename):
+    """Yield the contents of `filename` as a read-only memory map (b'' when empty)."""
+    with open(filename, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b''
+            return
+        with data:
+            yield data
+
+
+def read_ints(filename):
+    """Every integer in the file, in order, as one flat array."""
+    with mapped_file(filename) as data:
+        return array('q', map(int, int_tokens(data)))
+
+
+def read_int_columns(filename, columns):
+    """Split the file's integers into `columns` arrays, one value per column per record."""
+    values = read_ints(filename)
+    if len(values) % columns:
+        raise ValueError(f"{filename}: {len(values)} integers do not fill {columns} columns")
+    return tuple(values[column::columns] for column in range(columns))
+
+
+def read_int_rows(filename):
+    """One list of ints per non-empty line, for inputs whose rows have different lengths.
+
+    Rows are short and get sliced and indexed heavily by the solvers, so they
+    stay plain lists rather than arrays.
+    """
+    rows = []
+    with mapped_file(filename) as data:
+        for line in data[:].splitlines():
+            values = line.translate(INT_BYTES).split()
+            if values:
+                rows.append(list(map(int, values)))
+    return rows
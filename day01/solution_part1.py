@@ -1,23 +1,21 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.engines import ENGINES, as_int64, np, resolve_engine
+from common.ints import read_int_columns
+
 def parse_input(filename):
-    left_list = []
-    right_list = []
-    
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                left, right = map(int, line.split())
-                left_list.append(left)
-                right_list.append(right)
-    
+    left_list, right_list = read_int_columns(filename, 2)
     return left_list, right_list
 
-def calculate_total_distance(left_list, right_list):
+def calculate_total_distance(left_list, right_list, engine='python'):
+    if resolve_engine(engine) == 'numpy':
+        return calculate_total_distance_numpy(left_list, right_list)
+    
     left_sorted = sorted(left_list)
     right_sorted = sorted(right_list)
     
@@ -28,10 +26,26 @@ def calculate_total_distance(left_list, right_list):
         
     return total_distance
 
+def calculate_total_distance_numpy(left_list, right_list):
+    """Vectorised part 1: sort copies of both columns, then sum |left - right|.
+    
+    The caller's columns are left untouched.  The sorted copies are the
+    only new buffers: the differences are written into the right copy.
+    """
+    left = np.sort(as_int64(left_list))
+    right = np.sort(as_int64(right_list))
+    
+    # Reuse the right copy for the differences instead of allocating another
+    np.subtract(left, right, out=right)
+    np.abs(right, out=right)
+    return int(right.sum())
+
 def main():
     parser = argparse.ArgumentParser(description='Day 1 Part 1: Calculate total distance between lists')
     parser.add_argument('--test', action='store_true', help='Run with example.txt instead of input.txt')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--engine', choices=ENGINES, default='auto',
+                        help='python (reference), numpy (vectorised) or auto')
     
     args = parser.parse_args()
     
@@ -48,7 +62,7 @@ def main():
         print(f"Sorted left: {sorted(left_list)}")
         print(f"Sorted right: {sorted(right_list)}")
     
-    result = calculate_total_distance(left_list, right_list)
+    result = calculate_total_distance(left_list, right_list, args.engine)
     
     if args.debug or args.test:
         print(f"Total distance: {result}")
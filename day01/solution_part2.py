@@ -1,24 +1,22 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import argparse
 from collections import Counter
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.engines import ENGINES, as_int64, np, resolve_engine
+from common.ints import read_int_columns
+
 def parse_input(filename):
-    left_list = []
-    right_list = []
-    
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                left, right = map(int, line.split())
-                left_list.append(left)
-                right_list.append(right)
-    
+    left_list, right_list = read_int_columns(filename, 2)
     return left_list, right_list
 
-def calculate_similarity_score(left_list, right_list):
+def calculate_similarity_score(left_list, right_list, engine='python'):
+    if resolve_engine(engine) == 'numpy':
+        return calculate_similarity_score_numpy(left_list, right_list)
+    
     right_counts = Counter(right_list)
     
     similarity_score = 0
@@ -29,10 +27,77 @@ def calculate_similarity_score(left_list, right_list):
         
     return similarity_score
 
+def calculate_similarity_score_numpy(left_list, right_list):
+    """Vectorised part 2: count right values with np.unique, look left values up with searchsorted."""
+    left = as_int64(left_list)
+    values, counts = np.unique(as_int64(right_list), return_counts=True)
+    if not len(values):
+        return 0
+    
+    # Position of each left value among the distinct right values
+    positions = np.searchsorted(values, left)
+    np.minimum(positions, len(values) - 1, out=positions)
+    present = values[positions] == left
+    matched, weights = left[present], counts[positions[present]]
+    if not len(matched):
+        return 0
+    
+    # int64 dot products wrap silently; sum as Python ints when the score could reach 2**63
+    largest = max(-int(matched.min()), int(matched.max()))
+    if largest * int(weights.sum()) >= 2**63:
+        matched, weights = matched.astype(object), weights.astype(object)
+    return int(np.dot(matched, weights))
+
+class SimilarityTracker:
+    """Part 2 score kept up to date while both lists change.
+    
+    The score is the sum over values v of v * count_left(v) * count_right(v),
+    so inserting or deleting one value only changes the term for that value:
+    each update is O(1) instead of recounting the right list.
+    """
+    
+    def __init__(self, left_list=(), right_list=()):
+        self.left_counts = Counter()
+        self.right_counts = Counter()
+        self._score = 0
+        for num in left_list:
+            self.add_left(num)
+        for num in right_list:
+            self.add_right(num)
+    
+    def add_left(self, num):
+        self.left_counts[num] += 1
+        self._score += num * self.right_counts[num]
+    
+    def add_right(self, num):
+        self.right_counts[num] += 1
+        self._score += num * self.left_counts[num]
+    
+    def remove_left(self, num):
+        self._remove(self.left_counts, num)
+        self._score -= num * self.right_counts[num]
+    
+    def remove_right(self, num):
+        self._remove(self.right_counts, num)
+        self._score -= num * self.left_counts[num]
+    
+    @staticmethod
+    def _remove(counts, num):
+        if counts[num] <= 0:
+            raise ValueError(f"{num} is not in the list")
+        counts[num] -= 1
+        if not counts[num]:
+            del counts[num]
+    
+    def score(self):
+        return self._score
+
 def main():
     parser = argparse.ArgumentParser(description='Day 1 Part 2: Calculate similarity score between lists')
     parser.add_argument('--test', action='store_true', help='Run with example.txt instead of input.txt')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--engine', choices=ENGINES, default='auto',
+                        help='python (reference), numpy (vectorised) or auto')
     
     args = parser.parse_args()
     
@@ -58,7 +123,7 @@ def main():
             print(f"  {num} appears {count} times: {num} * {count} = {contribution}")
         print(f"Total similarity score: {total}")
     
-    result = calculate_similarity_score(left_list, right_list)
+    result = calculate_similarity_score(left_list, right_list, args.engine)
     
     if not (args.debug or args.test):
         print(result)
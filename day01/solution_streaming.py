@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""External-memory day 1 for location lists larger than RAM.
+
+The input is read `chunk_size` pairs at a time; each chunk's left and right
+columns are sorted and written to temporary run files.  Part 1 pairs the
+k-way merges of the left and right runs.  Part 2 walks the same two sorted
+streams and builds the right-hand frequency table incrementally, one
+distinct value at a time, so no table of all right values is ever held.
+Peak memory is one chunk plus one small read buffer per run.
+
+At most `fan_in` run files are open at once.  When there are more runs,
+groups of up to `fan_in` runs are merged into longer runs, pass after
+pass, until the left and right runs together fit in one final merge.
+"""
+
+import os
+import sys
+import heapq
+import argparse
+import tempfile
+from array import array
+from itertools import groupby, islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.ints import int_tokens
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+DEFAULT_FAN_IN = 64
+
+def read_chunks(filename, chunk_size):
+    """Yield (left, right) array('q') columns of at most chunk_size pairs each."""
+    with open(filename, 'rb') as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                break
+            values = array('q', map(int, int_tokens(b''.join(lines))))
+            yield values[0::2], values[1::2]
+
+def write_sorted_runs(filename, chunk_size, directory):
+    """Sort each chunk and spill it to disk; returns the left and right run file paths."""
+    left_runs = []
+    right_runs = []
+    
+    for index, (left, right) in enumerate(read_chunks(filename, chunk_size)):
+        for column, runs, side in ((left, left_runs, 'left'), (right, right_runs, 'right')):
+            path = os.path.join(directory, f"{side}_{index:05d}.bin")
+            with open(path, 'wb') as f:
+                array('q', sorted(column)).tofile(f)
+            runs.append(path)
+    
+    return left_runs, right_runs
+
+def read_run(path, buffer_size):
+    """Stream the int64 values of one run file, buffer_size values at a time."""
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(buffer_size * 8)
+            if not block:
+                break
+            yield from array('q', block)
+
+def merge_runs(runs, chunk_size):
+    """k-way merge of sorted run files into one sorted stream."""
+    # The read buffers together stay within one chunk
+    buffer_size = max(1, chunk_size // max(1, len(runs)))
+    return heapq.merge(*(read_run(path, buffer_size) for path in runs))
+
+def write_merged_run(runs, path, chunk_size):
+    """Merge sorted run files into one run file, with all buffers together within one chunk."""
+    # One read buffer per input run plus the output buffer
+    buffer_size = max(1, chunk_size // (len(runs) + 1))
+    merged = heapq.merge(*(read_run(run, buffer_size) for run in runs))
+    with open(path, 'wb') as f:
+        while True:
+            block = array('q', islice(merged, buffer_size))
+            if not block:
+                break
+            block.tofile(f)
+
+def reduce_runs(runs, max_runs, fan_in, chunk_size, directory, side):
+    """Merge groups of at most fan_in runs, pass after pass, until at most max_runs are left."""
+    level = 0
+    while len(runs) > max_runs:
+        level += 1
+        merged = []
+        for start in range(0, len(runs), fan_in):
+            group = runs[start:start + fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            path = os.path.join(directory, f"{side}_pass{level}_{start // fan_in:05d}.bin")
+            write_merged_run(group, path, chunk_size)
+            for run in group:
+                os.remove(run)
+            merged.append(path)
+        runs = merged
+    return runs
+
+def stream_total_distance(left_runs, right_runs, chunk_size):
+    total_distance = 0
+    for left_val, right_val in zip(merge_runs(left_runs, chunk_size), merge_runs(right_runs, chunk_size)):
+        total_distance += abs(left_val - right_val)
+    return total_distance
+
+def stream_similarity_score(left_runs, right_runs, chunk_size):
+    """Merge-join the sorted streams; value v contributes v * count_left(v) * count_right(v)."""
+    left_counts = ((value, sum(1 for _ in group)) for value, group in groupby(merge_runs(left_runs, chunk_size)))
+    right_counts = ((value, sum(1 for _ in group)) for value, group in groupby(merge_runs(right_runs, chunk_size)))
+    
+    similarity_score = 0
+    right_value, right_count = next(right_counts, (None, 0))
+    for left_value, left_count in left_counts:
+        # Advance the right-hand frequency table up to the current left value
+        while right_value is not None and right_value < left_value:
+            right_value, right_count = next(right_counts, (None, 0))
+        if right_value is None:
+            break
+        if right_value == left_value:
+            similarity_score += left_value * left_count * right_count
+    
+    return similarity_score
+
+def solve_streaming(filename, chunk_size=DEFAULT_CHUNK_SIZE, temp_dir=None, fan_in=DEFAULT_FAN_IN):
+    """Both parts with memory bounded by chunk_size and at most fan_in run files open at once.
+    
+    Returns (total_distance, similarity_score).
+    """
+    if fan_in < 2:
+        raise ValueError(f"fan_in must be at least 2, got {fan_in}")
+    
+    with tempfile.TemporaryDirectory(prefix='day01_runs_', dir=temp_dir) as directory:
+        left_runs, right_runs = write_sorted_runs(filename, chunk_size, directory)
+        
+        # The final merges read both sides at once, so each side gets half the fan-in
+        left_runs = reduce_runs(left_runs, fan_in // 2, fan_in, chunk_size, directory, 'left')
+        right_runs = reduce_runs(right_runs, fan_in // 2, fan_in, chunk_size, directory, 'right')
+        
+        total_distance = stream_total_distance(left_runs, right_runs, chunk_size)
+        similarity_score = stream_similarity_score(left_runs, right_runs, chunk_size)
+    
+    return total_distance, similarity_score
+
+def main():
+    parser = argparse.ArgumentParser(description='Day 1: both parts in bounded memory via sorted runs on disk')
+    parser.add_argument('file', nargs='?', help='Input file (default: input.txt)')
+    parser.add_argument('--test', action='store_true', help='Run with example.txt instead of input.txt')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='Pairs held in memory at once (default: %(default)s)')
+    parser.add_argument('--temp-dir', help='Where to put the run files (default: system temp dir)')
+    parser.add_argument('--fan-in', type=int, default=DEFAULT_FAN_IN,
+                        help='Most run files open at once; more runs are merged in passes (default: %(default)s)')
+    
+    args = parser.parse_args()
+    
+    filename = args.file or ('example.txt' if args.test else 'input.txt')
+    total_distance, similarity_score = solve_streaming(filename, args.chunk_size, args.temp_dir, args.fan_in)
+    
+    print(f"Part 1: {total_distance}")
+    print(f"Part 2: {similarity_score}")
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,16 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import argparse
+from itertools import chain
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.engines import ENGINES, np, resolve_engine
+from common.ints import read_int_rows
 
 def parse_input(filename):
-    reports = []
-    
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                levels = list(map(int, line.split()))
-                reports.append(levels)
-    
-    return reports
+    return read_int_rows(filename)
 
 def is_safe_report(levels):
     if len(levels) < 2:
@@ -40,7 +37,35 @@ def is_safe_report(levels):
     
     return True
 
-def count_safe_reports(reports):
+def pack_reports(reports):
+    """Pack variable-length reports into a zero-padded 2-D int64 array plus their lengths."""
+    lengths = np.fromiter(map(len, reports), dtype=np.int64, count=len(reports))
+    width = int(lengths.max()) if len(reports) else 0
+    flat = np.fromiter(chain.from_iterable(reports), dtype=np.int64, count=int(lengths.sum()))
+    
+    # Row-major boolean assignment fills each row's leading cells in order
+    matrix = np.zeros((len(reports), width), dtype=np.int64)
+    matrix[np.arange(width) < lengths[:, None]] = flat
+    return matrix, lengths
+
+def safe_rows(matrix, lengths):
+    """Boolean mask of safe reports, checking every row in one shot."""
+    diffs = np.diff(matrix, axis=1)
+    # Differences past a row's last level come from padding and are ignored
+    padding = np.arange(diffs.shape[1]) >= (lengths[:, None] - 1)
+    increasing = ((diffs >= 1) & (diffs <= 3)) | padding
+    decreasing = ((diffs <= -1) & (diffs >= -3)) | padding
+    return increasing.all(axis=1) | decreasing.all(axis=1)
+
+def count_safe_reports_numpy(reports):
+    if not reports:
+        return 0
+    return int(safe_rows(*pack_reports(reports)).sum())
+
+def count_safe_reports(reports, engine='python'):
+    if resolve_engine(engine) == 'numpy':
+        return count_safe_reports_numpy(reports)
+    
     safe_count = 0
     for report in reports:
         if is_safe_report(report):
@@ -51,6 +76,8 @@ def main():
     parser = argparse.ArgumentParser(description='Day 2 Part 1: Count safe reactor reports')
     parser.add_argument('--test', action='store_true', help='Run with example.txt instead of input.txt')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--engine', choices=ENGINES, default='auto',
+                        help='python (reference), numpy (vectorised) or auto')
     
     args = parser.parse_args()
     
@@ -74,7 +101,7 @@ def main():
                     diffs = [report[j] - report[j-1] for j in range(1, len(report))]
                     print(f"  Differences: {diffs}")
     
-    result = count_safe_reports(reports)
+    result = count_safe_reports(reports, args.engine)
     
     if args.debug or args.test:
         print(f"\nSafe reports: {result}")
@@ -1,19 +1,16 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.engines import ENGINES, np, resolve_engine
+from common.ints import read_int_rows
+from solution_part1 import pack_reports, safe_rows
+
 def parse_input(filename):
-    reports = []
-    
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                levels = list(map(int, line.split()))
-                reports.append(levels)
-    
-    return reports
+    return read_int_rows(filename)
 
 def is_safe_report(levels):
     if len(levels) < 2:
@@ -54,17 +51,99 @@ def is_safe_with_dampener(levels):
     
     return False
 
-def count_safe_reports_with_dampener(reports):
+def is_safe_step(a, b, sign):
+    return 1 <= (b - a) * sign <= 3
+
+def first_bad_step(levels, sign):
+    """Index i of the first pair (i, i+1) that breaks the rule for direction sign, or -1."""
+    for i in range(len(levels) - 1):
+        if not is_safe_step(levels[i], levels[i + 1], sign):
+            return i
+    return -1
+
+def is_safe_skipping(levels, skip, sign):
+    """Whether levels without index skip are safe in direction sign, without building a new list."""
+    prev = None
+    for i in range(len(levels)):
+        if i == skip:
+            continue
+        if prev is not None and not is_safe_step(levels[prev], levels[i], sign):
+            return False
+        prev = i
+    return True
+
+def is_safe_with_dampener_linear(levels):
+    """O(n) dampener check.
+    
+    For each direction, a removal can only fix the report if it removes one of
+    the two levels of the first bad pair (any other removal leaves that pair
+    adjacent), so at most four O(n) scans are needed.
+    """
+    if len(levels) <= 2:
+        return True
+    
+    for sign in (1, -1):
+        bad = first_bad_step(levels, sign)
+        if bad < 0:
+            return True
+        if is_safe_skipping(levels, bad, sign) or is_safe_skipping(levels, bad + 1, sign):
+            return True
+    
+    return False
+
+def count_safe_with_dampener_numpy(reports):
+    """All reports at once: each dampener variant deletes one column from the packed array."""
+    if not reports:
+        return 0
+    
+    matrix, lengths = pack_reports(reports)
+    safe = safe_rows(matrix, lengths)
+    
+    for column in range(matrix.shape[1]):
+        # Only rows long enough to have this column actually lose a level
+        has_column = column < lengths
+        dampened = np.delete(matrix, column, axis=1)
+        safe |= has_column & safe_rows(dampened, lengths - has_column)
+    
+    return int(safe.sum())
+
+DAMPENERS = {
+    'linear': is_safe_with_dampener_linear,
+    'reference': is_safe_with_dampener,
+}
+
+METHODS = sorted(DAMPENERS)
+
+def count_safe_reports_with_dampener(reports, method='linear', engine='python'):
+    """Safe reports with one level removable; `method` picks the python engine's dampener check."""
+    if method not in DAMPENERS:
+        raise ValueError(f"unknown method {method!r}, expected one of {', '.join(METHODS)}")
+    if resolve_engine(engine) == 'numpy':
+        return count_safe_with_dampener_numpy(reports)
+    
+    is_safe = DAMPENERS[method]
     safe_count = 0
     for report in reports:
-        if is_safe_with_dampener(report):
+        if is_safe(report):
             safe_count += 1
     return safe_count
 
+def find_dampener_mismatches(reports):
+    """Reports on which the linear and reference checks disagree (differential testing)."""
+    return [report for report in reports
+            if is_safe_with_dampener_linear(report) != is_safe_with_dampener(report)]
+
 def main():
     parser = argparse.ArgumentParser(description='Day 2 Part 2: Count safe reactor reports with Problem Dampener')
     parser.add_argument('--test', action='store_true', help='Run with example.txt instead of input.txt')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--method', choices=METHODS, default='linear',
+                        help='Dampener check for the python engine: linear (single pass) '
+                             'or reference (try every removal)')
+    parser.add_argument('--engine', choices=ENGINES, default='auto',
+                        help='python (one report at a time), numpy (all reports at once) or auto')
+    parser.add_argument('--check', action='store_true',
+                        help='Run both dampener checks on every report and list disagreements')
     
     args = parser.parse_args()
     
@@ -100,7 +179,13 @@ def main():
             
             print(f"Report {i+1}: {report} -> {status} {reason}")
     
-    result = count_safe_reports_with_dampener(reports)
+    if args.check:
+        mismatches = find_dampener_mismatches(reports)
+        print(f"Dampener checks disagree on {len(mismatches)} of {len(reports)} reports")
+        for report in mismatches:
+            print(f"  {report}")
+    
+    result = count_safe_reports_with_dampener(reports, args.method, args.engine)
     
     if args.debug or args.test:
         print(f"\nSafe reports with dampener: {result}")
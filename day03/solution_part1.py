@@ -7,7 +7,68 @@ def parse_input(filename):
     with open(filename, 'r') as f:
         return f.read()
 
-def find_valid_mul_instructions(memory):
+# Token kinds produced by tokenize()
+MUL, DO, DONT = 'mul', 'do', "don't"
+
+ENGINES = ('regex', 'tokenizer')
+
+def read_number(buffer, i, terminator):
+    """Parse 1-3 digits at i followed by terminator; returns (value, next index) or (None, i)."""
+    value = 0
+    j = i
+    while j < len(buffer) and j - i < 3 and 48 <= buffer[j] <= 57:
+        value = value * 10 + buffer[j] - 48
+        j += 1
+    if j == i or j >= len(buffer) or buffer[j] != terminator:
+        return None, i
+    return value, j + 1
+
+def tokenize(buffer):
+    """Single pass over bytes yielding (MUL, x, y), (DO,) and (DONT,) in order.
+    
+    Only 'm' and 'd' can start a token, so the scan jumps between those bytes
+    with bytes.find and runs a small state machine (literal prefix, digits,
+    separator, digits, ')') at each candidate.
+    """
+    if isinstance(buffer, str):
+        buffer = buffer.encode()
+    end = len(buffer)
+    next_m = buffer.find(b'm')
+    next_d = buffer.find(b'd')
+    
+    while next_m >= 0 or next_d >= 0:
+        if next_d < 0 or 0 <= next_m < next_d:
+            i = next_m
+            resume = i + 1
+            if buffer.startswith(b'mul(', i):
+                x, j = read_number(buffer, i + 4, 44)  # ','
+                if x is not None:
+                    y, j = read_number(buffer, j, 41)  # ')'
+                    if y is not None:
+                        yield MUL, x, y
+                        resume = j
+            next_m = buffer.find(b'm', resume) if resume < end else -1
+            if 0 <= next_d < resume:
+                next_d = buffer.find(b'd', resume)
+        else:
+            i = next_d
+            resume = i + 1
+            if buffer.startswith(b'do()', i):
+                yield (DO,)
+                resume = i + 4
+            elif buffer.startswith(b"don't()", i):
+                yield (DONT,)
+                resume = i + 7
+            next_d = buffer.find(b'd', resume) if resume < end else -1
+            if 0 <= next_m < resume:
+                next_m = buffer.find(b'm', resume)
+
+def find_valid_mul_instructions(memory, engine='regex'):
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}, expected one of {', '.join(ENGINES)}")
+    if engine == 'tokenizer':
+        return [(token[1], token[2]) for token in tokenize(memory) if token[0] == MUL]
+    
     # Pattern: mul(1-3 digits, 1-3 digits)
     pattern = r'mul\((\d{1,3}),(\d{1,3})\)'
     matches = re.findall(pattern, memory)
@@ -26,6 +87,8 @@ def main():
     parser = argparse.ArgumentParser(description='Day 3 Part 1: Sum valid mul instructions from corrupted memory')
     parser.add_argument('--test', action='store_true', help='Run with example.txt instead of input.txt')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--engine', choices=ENGINES, default='regex',
+                        help='regex (re.findall) or tokenizer (hand-written byte scanner)')
     
     args = parser.parse_args()
     
@@ -40,7 +103,7 @@ def main():
         print(f"Memory length: {len(memory)} characters")
         print(f"Memory content: {memory}")
     
-    instructions = find_valid_mul_instructions(memory)
+    instructions = find_valid_mul_instructions(memory, args.engine)
     
     if args.debug or args.test:
         print(f"\nFound {len(instructions)} valid mul instructions:")
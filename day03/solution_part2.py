@@ -3,11 +3,18 @@
 import re
 import argparse
 
+from solution_part1 import DO, DONT, ENGINES, MUL, tokenize
+
 def parse_input(filename):
     with open(filename, 'r') as f:
         return f.read()
 
-def process_instructions_with_conditionals(memory):
+def process_instructions_with_conditionals(memory, engine='regex'):
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}, expected one of {', '.join(ENGINES)}")
+    if engine == 'tokenizer':
+        return process_tokens_with_conditionals(memory)
+    
     # Pattern to match mul(X,Y), do(), or don't()
     pattern = r'(mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don\'t\(\))'
     matches = re.finditer(pattern, memory)
@@ -31,6 +38,22 @@ def process_instructions_with_conditionals(memory):
     
     return total
 
+def process_tokens_with_conditionals(memory):
+    enabled = True  # mul instructions start enabled
+    total = 0
+    
+    for token in tokenize(memory):
+        kind = token[0]
+        if kind == MUL:
+            if enabled:
+                total += token[1] * token[2]
+        elif kind == DO:
+            enabled = True
+        elif kind == DONT:
+            enabled = False
+    
+    return total
+
 def process_instructions_with_conditionals_debug(memory):
     # Pattern to match mul(X,Y), do(), or don't()
     pattern = r'(mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don\'t\(\))'
@@ -67,6 +90,8 @@ def main():
     parser = argparse.ArgumentParser(description='Day 3 Part 2: Sum enabled mul instructions with do/don\'t conditionals')
     parser.add_argument('--test', action='store_true', help='Run with example.txt instead of input.txt')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--engine', choices=ENGINES, default='regex',
+                        help='regex (re.finditer) or tokenizer (hand-written byte scanner)')
     
     args = parser.parse_args()
     
@@ -95,7 +120,7 @@ def main():
         
         print(f"\nTotal sum of enabled multiplications: {total}")
     else:
-        result = process_instructions_with_conditionals(memory)
+        result = process_instructions_with_conditionals(memory, args.engine)
         print(result)
 
 if __name__ == "__main__":
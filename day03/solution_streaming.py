@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Day 3 over memory dumps of any size, scanned in fixed-size chunks.
+
+Files are memory-mapped and stdin is read as a byte stream; either way only
+one chunk plus a short carry-over is held at a time.  No token is longer
+than MAX_TOKEN bytes (`mul(123,456)`), so a match starting more than
+MAX_TOKEN - 1 bytes before the end of the buffer is already final.  Matches
+starting later are left for the next chunk together with the unread tail.
+The do()/don't() state and both totals live in the scanner between chunks.
+
+With --jobs the file is instead cut into byte ranges scanned by a process
+pool.  Each range is summarised independently of the state it is entered
+in, and the summaries are folded left to right (see summarize_range).
+"""
+
+import os
+import re
+import sys
+import mmap
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+TOKEN_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+MAX_TOKEN = len(b"mul(123,456)")
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+class StreamScanner:
+    """Feed chunks in order; `total` is part 1, `enabled_total` is part 2."""
+    
+    def __init__(self):
+        self.carry = b''
+        self.enabled = True
+        self.total = 0
+        self.enabled_total = 0
+    
+    def feed(self, chunk, final=False):
+        buffer = self.carry + chunk
+        # Matches starting before limit cannot change when more data arrives
+        limit = len(buffer) if final else len(buffer) - (MAX_TOKEN - 1)
+        resume = max(limit, 0)
+    
+        for match in TOKEN_PATTERN.finditer(buffer):
+            if match.start() >= limit:
+                break
+            self.apply(match)
+            resume = max(resume, match.end())
+    
+        self.carry = buffer[resume:]
+    
+    def apply(self, match):
+        token = match.group(0)
+        if token == b"do()":
+            self.enabled = True
+        elif token == b"don't()":
+            self.enabled = False
+        else:
+            product = int(match.group(1)) * int(match.group(2))
+            self.total += product
+            if self.enabled:
+                self.enabled_total += product
+    
+    def finish(self):
+        self.feed(b'', final=True)
+        return self.total, self.enabled_total
+
+def iter_chunks(source, chunk_size):
+    """Yield chunks of a file (memory-mapped) or of stdin when source is '-'."""
+    if source == '-':
+        stream = sys.stdin.buffer
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    
+    with open(source, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for start in range(0, len(data), chunk_size):
+                yield data[start:start + chunk_size]
+
+def scan_stream(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Both parts in one pass over source; returns (part1_total, part2_total)."""
+    scanner = StreamScanner()
+    for chunk in iter_chunks(source, chunk_size):
+        scanner.feed(chunk)
+    return scanner.finish()
+
+def summarize_range(filename, start, end):
+    """Summarise the tokens that start in bytes [start, end) of the file.
+    
+    Returns (total, total_if_entered_enabled, total_if_entered_disabled,
+    exit_state), where exit_state is the last do()/don't() seen (True/False)
+    or None when the range passes the incoming state through.  No token can
+    start inside another one, so every cut point is a safe boundary: the
+    range owns the tokens starting in it and reads up to MAX_TOKEN - 1 bytes
+    past its end to complete the last one.
+    """
+    with open(filename, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            buffer = data[start:min(end + MAX_TOKEN - 1, len(data))]
+    
+    total = if_enabled = if_disabled = 0
+    exit_state = None
+    for match in TOKEN_PATTERN.finditer(buffer):
+        if match.start() >= end - start:
+            break
+        token = match.group(0)
+        if token == b"do()":
+            exit_state = True
+        elif token == b"don't()":
+            exit_state = False
+        else:
+            product = int(match.group(1)) * int(match.group(2))
+            total += product
+            if exit_state is None or exit_state:
+                if_enabled += product
+            if exit_state:
+                if_disabled += product
+    
+    return total, if_enabled, if_disabled, exit_state
+
+def fold_summaries(summaries):
+    """Combine range summaries in file order into (part1_total, part2_total)."""
+    enabled = True
+    total = enabled_total = 0
+    for range_total, if_enabled, if_disabled, exit_state in summaries:
+        total += range_total
+        enabled_total += if_enabled if enabled else if_disabled
+        if exit_state is not None:
+            enabled = exit_state
+    return total, enabled_total
+
+def scan_parallel(filename, jobs, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Both parts with byte ranges of at most chunk_size scanned on `jobs` processes."""
+    size = os.path.getsize(filename)
+    # Several ranges per worker keep the pool busy; chunk_size bounds each worker's memory
+    pieces = max(jobs * 4, -(-size // chunk_size), 1)
+    step = -(-size // pieces) or 1
+    starts = list(range(0, size, step))
+    ends = [min(start + step, size) for start in starts]
+    
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        summaries = pool.map(summarize_range, [filename] * len(starts), starts, ends)
+        return fold_summaries(summaries)
+
+def main():
+    parser = argparse.ArgumentParser(description='Day 3: both parts streamed over a file or stdin in fixed-size chunks')
+    parser.add_argument('file', nargs='?', help="Input file, or - for stdin (default: input.txt)")
+    parser.add_argument('--test', action='store_true', help='Run with example.txt instead of input.txt')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='Bytes read per chunk (default: %(default)s)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Scan byte ranges on this many processes and fold their summaries')
+    
+    args = parser.parse_args()
+    
+    filename = args.file or ('example.txt' if args.test else 'input.txt')
+    if args.jobs > 1:
+        if filename == '-':
+            parser.error('--jobs needs a file, stdin cannot be split')
+        total, enabled_total = scan_parallel(filename, args.jobs, args.chunk_size)
+    else:
+        total, enabled_total = scan_stream(filename, args.chunk_size)
+    
+    print(f"Part 1: {total}")
+    print(f"Part 2: {enabled_total}")
+
+if __name__ == "__main__":
+    main()
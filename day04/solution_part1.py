@@ -1,55 +1,72 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.engines import np, resolve_engine
+from common.grid import Grid
+
 def parse_input(filename):
-    """Parse the input file and return a 2D grid of characters."""
-    with open(filename, 'r') as f:
-        lines = f.read().strip().split('\n')
-    return [list(line) for line in lines]
+    """Parse the input file into a grid padded by 3 cells so a word never runs off the edge."""
+    return Grid.from_file(filename, pad=3, fill='.')
 
-def search_word(grid, row, col, direction, word):
-    """Check if word exists starting at (row, col) in given direction."""
-    rows, cols = len(grid), len(grid[0])
-    dr, dc = direction
+def search_word(grid, index, offset, word):
+    """Check if word exists starting at flat index in the direction given by offset."""
+    cells = grid.cells
     
     for i in range(len(word)):
-        new_row = row + i * dr
-        new_col = col + i * dc
-        
-        if (new_row < 0 or new_row >= rows or 
-            new_col < 0 or new_col >= cols or
-            grid[new_row][new_col] != word[i]):
+        if cells[index + i * offset] != word[i]:
             return False
     
     return True
 
-def count_xmas(grid):
+def count_xmas(grid, engine='python'):
     """Count all occurrences of XMAS in the grid."""
-    if not grid or not grid[0]:
+    if not grid.rows or not grid.cols:
         return 0
+    if resolve_engine(engine) == 'numpy':
+        return count_xmas_numpy(grid)
+    
+    word = b"XMAS"
+    count = 0
+    
+    # 8 directions: up, right, down, left and the four diagonals
+    directions = grid.directions + grid.diagonals
+    
+    # Every match starts on an X, so only those cells need checking
+    for index in grid.find_all('X'):
+        for offset in directions:
+            if search_word(grid, index, offset, word):
+                count += 1
     
-    rows, cols = len(grid), len(grid[0])
-    word = "XMAS"
+    return count
+
+def interior_span(grid):
+    """Flat [start, end) covering every unpadded cell (plus the side padding between rows)."""
+    return grid.index(0, 0), grid.index(grid.rows - 1, grid.cols - 1) + 1
+
+def count_xmas_numpy(grid, word=b"XMAS"):
+    """Vectorised part 1: per direction, AND the letter masks of the grid shifted by k * offset.
+    
+    The flat padded cells are viewed as uint8 without copying.  Shifting the
+    interior span by a flat offset moves every cell one step in that
+    direction at once, and the 3-cell padding keeps every shift inside the
+    buffer; padding never matches a letter, so edges need no special case.
+    """
+    cells = np.frombuffer(grid.cells, dtype=np.uint8)
+    start, end = interior_span(grid)
+    first = cells[start:end] == word[0]
+    mask = np.empty_like(first)
+    letter = np.empty_like(first)
     count = 0
     
-    # 8 directions: right, left, down, up, down-right, down-left, up-right, up-left
-    directions = [
-        (0, 1),   # right
-        (0, -1),  # left
-        (1, 0),   # down
-        (-1, 0),  # up
-        (1, 1),   # down-right
-        (1, -1),  # down-left
-        (-1, 1),  # up-right
-        (-1, -1)  # up-left
-    ]
-    
-    for row in range(rows):
-        for col in range(cols):
-            for direction in directions:
-                if search_word(grid, row, col, direction, word):
-                    count += 1
+    for offset in grid.directions + grid.diagonals:
+        mask[:] = first
+        for k in range(1, len(word)):
+            np.equal(cells[start + k * offset:end + k * offset], word[k], out=letter)
+            mask &= letter
+        count += int(np.count_nonzero(mask))
     
     return count
 
@@ -58,6 +75,13 @@ def main():
     test_mode = '--test' in sys.argv
     debug_mode = '--debug' in sys.argv
     
+    # python (reference), numpy (vectorised) or auto
+    engine = 'auto'
+    if '--engine' in sys.argv:
+        engine_idx = sys.argv.index('--engine')
+        if engine_idx + 1 < len(sys.argv):
+            engine = sys.argv[engine_idx + 1]
+    
     filename = 'example.txt' if test_mode else 'input.txt'
     
     if debug_mode:
@@ -66,13 +90,12 @@ def main():
     grid = parse_input(filename)
     
     if debug_mode:
-        print(f"Grid dimensions: {len(grid)}x{len(grid[0])}")
+        print(f"Grid dimensions: {grid.rows}x{grid.cols}")
         print("Grid:")
-        for row in grid:
-            print(''.join(row))
+        print(grid)
         print()
     
-    result = count_xmas(grid)
+    result = count_xmas(grid, engine)
     
     if test_mode or debug_mode:
         print(f"XMAS appears {result} times")
@@ -1,58 +1,86 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.engines import np, resolve_engine
+from common.grid import Grid
+from solution_part1 import interior_span
+
 def parse_input(filename):
-    """Parse the input file and return a 2D grid of characters."""
-    with open(filename, 'r') as f:
-        lines = f.read().strip().split('\n')
-    return [list(line) for line in lines]
+    """Parse the input file into a grid padded by one cell of '.'."""
+    return Grid.from_file(filename, pad=1, fill='.')
 
-def is_valid_xmas(grid, row, col):
-    """Check if 'A' at position forms a valid X-MAS pattern."""
-    rows, cols = len(grid), len(grid[0])
-    
-    # Check if we can form a 3x3 pattern around this position
-    if row < 1 or row >= rows - 1 or col < 1 or col >= cols - 1:
-        return False
+def is_valid_xmas(grid, index):
+    """Check if 'A' at flat index forms a valid X-MAS pattern."""
+    cells = grid.cells
     
     # Check if center is 'A'
-    if grid[row][col] != 'A':
+    if cells[index] != ord('A'):
         return False
     
-    # Get the two diagonals
+    # Get the two diagonals; border cells see padding and never match
     # Diagonal 1: top-left to bottom-right
-    diagonal1 = grid[row-1][col-1] + grid[row][col] + grid[row+1][col+1]
+    diagonal1 = (cells[index + grid.up + grid.left], cells[index + grid.down + grid.right])
     
     # Diagonal 2: top-right to bottom-left
-    diagonal2 = grid[row-1][col+1] + grid[row][col] + grid[row+1][col-1]
+    diagonal2 = (cells[index + grid.up + grid.right], cells[index + grid.down + grid.left])
     
     # Check if both diagonals form "MAS" or "SAM"
-    valid_patterns = ["MAS", "SAM"]
+    valid_patterns = ((ord('M'), ord('S')), (ord('S'), ord('M')))
     
     return diagonal1 in valid_patterns and diagonal2 in valid_patterns
 
-def count_xmas_patterns(grid):
+def count_xmas_patterns(grid, engine='python'):
     """Count all X-MAS pattern occurrences in the grid."""
-    if not grid or not grid[0]:
+    if not grid.rows or not grid.cols:
         return 0
+    if resolve_engine(engine) == 'numpy':
+        return count_xmas_patterns_numpy(grid)
     
-    rows, cols = len(grid), len(grid[0])
     count = 0
     
-    # Check each position that could be the center of an X
-    for row in range(1, rows - 1):
-        for col in range(1, cols - 1):
-            if is_valid_xmas(grid, row, col):
-                count += 1
+    # Check each 'A' that could be the center of an X
+    for index in grid.find_all('A'):
+        if is_valid_xmas(grid, index):
+            count += 1
     
     return count
 
+def count_xmas_patterns_numpy(grid):
+    """Vectorised part 2: compare the four diagonal neighbours of every cell at once.
+    
+    Each neighbour is the interior span of the uint8 cell view shifted by a
+    diagonal offset; the 1-cell padding keeps the shifts inside the buffer.
+    """
+    cells = np.frombuffer(grid.cells, dtype=np.uint8)
+    start, end = interior_span(grid)
+    
+    def neighbour(offset):
+        return cells[start + offset:end + offset]
+    
+    m, s = ord('M'), ord('S')
+    up_left, down_right = neighbour(grid.up + grid.left), neighbour(grid.down + grid.right)
+    up_right, down_left = neighbour(grid.up + grid.right), neighbour(grid.down + grid.left)
+    
+    # Both diagonals must read MAS or SAM through the centre 'A'
+    diagonal1 = ((up_left == m) & (down_right == s)) | ((up_left == s) & (down_right == m))
+    diagonal2 = ((up_right == m) & (down_left == s)) | ((up_right == s) & (down_left == m))
+    return int(np.count_nonzero((cells[start:end] == ord('A')) & diagonal1 & diagonal2))
+
 def main():
     # Check command line arguments
     test_mode = '--test' in sys.argv
     debug_mode = '--debug' in sys.argv
     
+    # python (reference), numpy (vectorised) or auto
+    engine = 'auto'
+    if '--engine' in sys.argv:
+        engine_idx = sys.argv.index('--engine')
+        if engine_idx + 1 < len(sys.argv):
+            engine = sys.argv[engine_idx + 1]
+    
     filename = 'example.txt' if test_mode else 'input.txt'
     
     if debug_mode:
@@ -61,22 +89,19 @@ def main():
     grid = parse_input(filename)
     
     if debug_mode:
-        print(f"Grid dimensions: {len(grid)}x{len(grid[0])}")
+        print(f"Grid dimensions: {grid.rows}x{grid.cols}")
         print("Grid:")
-        for row in grid:
-            print(''.join(row))
+        print(grid)
         print()
     
-    result = count_xmas_patterns(grid)
+    result = count_xmas_patterns(grid, engine)
     
     if debug_mode:
         print(f"X-MAS patterns found: {result}")
         # Show pattern locations for debugging
-        rows, cols = len(grid), len(grid[0])
-        for row in range(1, rows - 1):
-            for col in range(1, cols - 1):
-                if is_valid_xmas(grid, row, col):
-                    print(f"X-MAS found at center ({row}, {col})")
+        for index in grid.find_all('A'):
+            if is_valid_xmas(grid, index):
+                print(f"X-MAS found at center {grid.position(index)}")
     
     if test_mode or debug_mode:
         print(f"X-MAS appears {result} times")
@@ -9,8 +9,11 @@ def parse_input(filename):
         lines = f.read().strip().split('\n')
     return [list(line) for line in lines]
 
-def extract_all_lines(grid):
-    """Extract all possible lines from the grid in all 8 directions."""
+def extract_all_lines(grid, min_length=4):
+    """Extract all possible lines from the grid in all 8 directions.
+    
+    Diagonals shorter than min_length (default: len("XMAS")) are skipped.
+    """
     if not grid or not grid[0]:
         return []
     
@@ -34,7 +37,7 @@ def extract_all_lines(grid):
             diagonal.append(grid[row][col])
             row += 1
             col += 1
-        if len(diagonal) >= 4:  # Only include if long enough for XMAS
+        if len(diagonal) >= min_length:  # Only include if long enough for the word
             lines.append(''.join(diagonal))
     
     # Starting from left column (excluding top-left corner to avoid duplication)
@@ -45,7 +48,7 @@ def extract_all_lines(grid):
             diagonal.append(grid[row][col])
             row += 1
             col += 1
-        if len(diagonal) >= 4:
+        if len(diagonal) >= min_length:
             lines.append(''.join(diagonal))
     
     # Diagonal lines (top-right to bottom-left)
@@ -57,7 +60,7 @@ def extract_all_lines(grid):
             diagonal.append(grid[row][col])
             row += 1
             col -= 1
-        if len(diagonal) >= 4:
+        if len(diagonal) >= min_length:
             lines.append(''.join(diagonal))
     
     # Starting from right column (excluding top-right corner to avoid duplication)
@@ -68,7 +71,7 @@ def extract_all_lines(grid):
             diagonal.append(grid[row][col])
             row += 1
             col -= 1
-        if len(diagonal) >= 4:
+        if len(diagonal) >= min_length:
             lines.append(''.join(diagonal))
     
     return lines
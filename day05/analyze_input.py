@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from rule_coverage import RuleBitsets
+
 def parse_input(filename):
     """Parse the input file and return rules and updates separately."""
     with open(filename, 'r') as f:
@@ -24,29 +26,25 @@ def parse_input(filename):
     
     return rules, updates
 
-def analyze_coverage(rules, updates):
-    """Analyze if all pages in updates are covered by rules."""
-    # Get all pages that appear in rules
-    pages_in_rules = set()
-    for before, after in rules:
-        pages_in_rules.add(before)
-        pages_in_rules.add(after)
-    
-    # Get all pages that appear in updates
+def update_pages(updates):
+    """Every page that appears in some update."""
     pages_in_updates = set()
     for update in updates:
         pages_in_updates.update(update)
+    return pages_in_updates
+
+def analyze_coverage(rules, updates, bitsets=None):
+    """Analyze if all pages in updates are covered by rules."""
+    pages_in_updates = update_pages(updates)
+    bitsets = bitsets or RuleBitsets(rules, pages_in_updates)
     
-    # Find pages that appear in updates but not in rules
-    uncovered_pages = pages_in_updates - pages_in_rules
-    
-    # Find pages that appear in rules but not in updates
-    unused_rules_pages = pages_in_rules - pages_in_updates
+    # Pages in updates without rules, and pages in rules that no update uses
+    uncovered_pages, unused_rules_pages = bitsets.coverage(pages_in_updates)
     
     print(f"=== Input Analysis ===")
     print(f"Total rules: {len(rules)}")
     print(f"Total updates: {len(updates)}")
-    print(f"Pages mentioned in rules: {len(pages_in_rules)}")
+    print(f"Pages mentioned in rules: {len(bitsets.members(bitsets.ruled))}")
     print(f"Pages mentioned in updates: {len(pages_in_updates)}")
     print()
     
@@ -69,21 +67,13 @@ def analyze_coverage(rules, updates):
     
     return uncovered_pages, unused_rules_pages
 
-def analyze_rule_density(rules, updates):
+def analyze_rule_density(rules, updates, bitsets=None):
     """Analyze how many rules exist for each page in updates."""
-    # Get all pages in updates
-    pages_in_updates = set()
-    for update in updates:
-        pages_in_updates.update(update)
+    pages_in_updates = update_pages(updates)
+    bitsets = bitsets or RuleBitsets(rules, pages_in_updates)
     
-    # Count rules for each page
-    rule_count = {}
-    for page in pages_in_updates:
-        count = 0
-        for before, after in rules:
-            if page == before or page == after:
-                count += 1
-        rule_count[page] = count
+    # Count rules for each page with one popcount per side
+    rule_count = bitsets.rule_counts(pages_in_updates)
     
     print(f"\n=== Rule Density Analysis ===")
     print(f"Rules per page (sorted by rule count):")
@@ -101,14 +91,21 @@ def analyze_rule_density(rules, updates):
     print(f"  Average rules per page: {avg_rules:.1f}")
     
     # Find pages with minimal rules
-    minimal_pages = [page for page, count in rule_count.items() if count == min_rules]
-    print(f"  Pages with minimal rules ({min_rules}): {sorted(minimal_pages)}")
+    min_rules, minimal_pages = bitsets.minimal_pages(pages_in_updates)
+    print(f"  Pages with minimal rules ({min_rules}): {minimal_pages}")
+    
+    # How close each update's rules come to a total order
+    densities = [bitsets.density(update) for update in updates]
+    total_orders = sum(1 for density in densities if density == 1.0)
+    print(f"  Updates whose pages are fully ordered by rules: {total_orders}/{len(updates)}")
+    print(f"  Lowest pair coverage within an update: {min(densities):.1%}")
 
 def main():
     rules, updates = parse_input('input.txt')
+    bitsets = RuleBitsets(rules, update_pages(updates))
     
-    uncovered, unused = analyze_coverage(rules, updates)
-    analyze_rule_density(rules, updates)
+    uncovered, unused = analyze_coverage(rules, updates, bitsets)
+    analyze_rule_density(rules, updates, bitsets)
     
     print(f"\n=== Conclusion ===")
     if not uncovered:
@@ -1,6 +1,14 @@
 #!/usr/bin/env python3
 
 import sys
+from functools import cmp_to_key
+
+from solution_part1 import build_rule_index, is_correctly_ordered_indexed, rules_are_acyclic
+
+# bubble: the reference O(n^2) sort; cmp: sorted() with a rule comparator;
+# topo: topological sort of the rules between the update's pages;
+# rank: RuleOrder, a global rank or one memoised order per page set
+METHODS = ('bubble', 'cmp', 'topo', 'rank')
 
 def parse_input(filename):
     """Parse the input file and return rules and updates separately."""
@@ -61,20 +69,165 @@ def bubble_sort_with_rules(pages, rules):
     
     return sorted_pages
 
+def sort_with_comparator(pages, successors):
+    """O(n log n) sort; relies on the rules ordering every pair in the update, as the puzzle's do."""
+    empty = frozenset()
+    
+    def compare(page_a, page_b):
+        if page_b in successors.get(page_a, empty):
+            return -1
+        if page_a in successors.get(page_b, empty):
+            return 1
+        return 0
+    
+    return sorted(pages, key=cmp_to_key(compare))
+
+def topological_sort(pages, successors):
+    """Kahn's algorithm over the rules restricted to the update's pages.
+    
+    Linear in the pages plus the rules between them (quadratic when every
+    pair has a rule, as in the puzzle), but unlike the comparator sort it
+    is correct for acyclic rule sets that leave some pairs unordered.
+    """
+    page_set = set(pages)
+    empty = frozenset()
+    edges = {page: successors.get(page, empty) & page_set for page in pages}
+    
+    in_degree = dict.fromkeys(pages, 0)
+    for targets in edges.values():
+        for page in targets:
+            in_degree[page] += 1
+    
+    ready = [page for page in pages if in_degree[page] == 0]
+    ordered = []
+    while ready:
+        page = ready.pop()
+        ordered.append(page)
+        for target in edges[page]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                ready.append(target)
+    
+    if len(ordered) != len(pages):
+        raise ValueError(f"rules between pages {sorted(pages)} contain a cycle")
+    return ordered
+
+def find_cycle(successors, remaining):
+    """A cycle among the pages Kahn's algorithm could not place, as [a, b, ..., a]."""
+    # Every leftover page still has a predecessor among the leftovers, so walk backwards
+    predecessors = {}
+    for page in remaining:
+        for target in successors.get(page, ()):
+            if target in remaining:
+                predecessors.setdefault(target, page)
+    
+    path = [next(iter(remaining))]
+    seen = {path[0]: 0}
+    while True:
+        page = predecessors[path[-1]]
+        if page in seen:
+            cycle = path[seen[page]:][::-1]
+            return cycle + cycle[:1]
+        seen[page] = len(path)
+        path.append(page)
+
+def global_rank(successors):
+    """Topological rank of every page in the rules, or (None, cycle) if the rules are cyclic."""
+    pages = set(successors)
+    for targets in successors.values():
+        pages |= targets
+    
+    in_degree = dict.fromkeys(pages, 0)
+    for targets in successors.values():
+        for page in targets:
+            in_degree[page] += 1
+    
+    ready = [page for page in pages if in_degree[page] == 0]
+    rank = {}
+    while ready:
+        page = ready.pop()
+        rank[page] = len(rank)
+        for target in successors.get(page, ()):
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                ready.append(target)
+    
+    if len(rank) != len(pages):
+        return None, find_cycle(successors, pages - rank.keys())
+    return rank, None
+
+class RuleOrder:
+    """Orders updates without comparisons, from one order per distinct page set.
+    
+    When the full rule graph is acyclic, a global topological rank orders
+    every page set.  Otherwise (the puzzle's rules are cyclic, only their
+    restriction to each update is not) each page set is sorted
+    topologically on first use.  Either way the order is memoised by
+    frozenset, so a repeated update is checked and repaired in O(n).
+    """
+    
+    def __init__(self, rules):
+        self.successors = build_rule_index(rules)
+        self.rank, self.cycle = global_rank(self.successors)
+        self.orders = {}
+    
+    def order_for(self, pages):
+        """(ordered pages, unique) for the set of `pages`, computed once per set."""
+        key = frozenset(pages)
+        cached = self.orders.get(key)
+        if cached is None:
+            if self.rank is not None:
+                # Pages without any rule can go anywhere; put them first
+                ordered = sorted(key, key=lambda page: self.rank.get(page, -1))
+            else:
+                ordered = topological_sort(list(key), self.successors)
+            # The order is the only valid one exactly when each consecutive pair has a rule
+            empty = frozenset()
+            unique = all(after in self.successors.get(before, empty)
+                         for before, after in zip(ordered, ordered[1:]))
+            cached = self.orders[key] = (ordered, unique)
+        return cached
+    
+    def is_ordered(self, update):
+        ordered, unique = self.order_for(update)
+        if unique:
+            return update == ordered
+        return is_correctly_ordered_indexed(update, self.successors, self.rank is not None)
+    
+    def reorder(self, update):
+        return list(self.order_for(update)[0])
+
 def get_middle_page(update):
     """Get the middle page number from an update."""
     return update[len(update) // 2]
 
-def solve_part2(rules, updates):
+def solve_part2(rules, updates, method='cmp'):
     """Fix incorrectly ordered updates and sum their middle page numbers."""
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}, expected one of {', '.join(METHODS)}")
+    
+    if method == 'bubble':
+        is_ordered = lambda update: is_correctly_ordered(update, rules)
+        repair = lambda update: bubble_sort_with_rules(update, rules)
+    elif method == 'rank':
+        order = RuleOrder(rules)
+        is_ordered = order.is_ordered
+        repair = order.reorder
+    else:
+        successors = build_rule_index(rules)
+        acyclic = rules_are_acyclic(successors)
+        sort = sort_with_comparator if method == 'cmp' else topological_sort
+        is_ordered = lambda update: is_correctly_ordered_indexed(update, successors, acyclic)
+        repair = lambda update: sort(update, successors)
+    
     middle_page_sum = 0
     incorrect_updates = []
     corrected_updates = []
     
     for update in updates:
-        if not is_correctly_ordered(update, rules):
+        if not is_ordered(update):
             # This update is incorrectly ordered, so fix it
-            corrected_update = bubble_sort_with_rules(update, rules)
+            corrected_update = repair(update)
             middle_page = get_middle_page(corrected_update)
             middle_page_sum += middle_page
             
@@ -88,6 +241,12 @@ def main():
     test_mode = '--test' in sys.argv
     debug_mode = '--debug' in sys.argv
     
+    method = 'cmp'
+    if '--method' in sys.argv:
+        method_idx = sys.argv.index('--method')
+        if method_idx + 1 < len(sys.argv):
+            method = sys.argv[method_idx + 1]
+    
     filename = 'example.txt' if test_mode else 'input.txt'
     
     if debug_mode:
@@ -99,9 +258,15 @@ def main():
         print(f"Parsed {len(rules)} rules and {len(updates)} updates")
         print("Sample rules:", list(rules)[:5])
         print("Sample updates:", updates[:3])
+        if method == 'rank':
+            order = RuleOrder(rules)
+            if order.cycle:
+                print(f"Rules are cyclic ({' -> '.join(map(str, order.cycle))}), ordering each page set separately")
+            else:
+                print(f"Rules are acyclic, one global rank over {len(order.rank)} pages")
         print()
     
-    result, incorrect, corrected = solve_part2(rules, updates)
+    result, incorrect, corrected = solve_part2(rules, updates, method)
     
     if debug_mode:
         print("Incorrectly ordered updates and their corrections:")
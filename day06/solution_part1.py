@@ -1,76 +1,164 @@
 #!/usr/bin/env python3
 
+import os
 import sys
+from bisect import bisect_left, bisect_right
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import counters
+from common.grid import Grid
+
+# step: walk one cell at a time; jump: go straight to the next obstacle via ObstacleIndex
+METHODS = ('step', 'jump')
 
 def parse_input(filename):
     """Parse the input file and return grid and guard starting position."""
-    with open(filename, 'r') as f:
-        lines = f.read().strip().split('\n')
-    
-    grid = [list(line) for line in lines]
-    guard_pos = None
+    # Padding cells are ' ' so stepping off the map is a single byte test
+    grid = Grid.from_file(filename, pad=1, fill=' ')
     
     # Find guard starting position (marked with ^)
-    for row in range(len(grid)):
-        for col in range(len(grid[row])):
-            if grid[row][col] == '^':
-                guard_pos = (row, col)
-                grid[row][col] = '.'  # Replace with empty space
-                break
-        if guard_pos:
-            break
+    guard_index = grid.find('^')
+    if guard_index < 0:
+        return grid, None
+    grid.cells[guard_index] = ord('.')  # Replace with empty space
     
-    return grid, guard_pos
+    return grid, grid.position(guard_index)
 
-def is_valid_position(row, col, grid):
-    """Check if position is within grid boundaries."""
-    return 0 <= row < len(grid) and 0 <= col < len(grid[0])
-
-def has_obstacle(row, col, grid):
-    """Check if position contains an obstacle."""
-    if not is_valid_position(row, col, grid):
-        return False
-    return grid[row][col] == '#'
-
-def simulate_guard_path(grid, start_pos):
+def simulate_guard_path(grid, start_pos, method='step'):
     """Simulate guard movement and return set of visited positions."""
-    # Direction vectors: up, right, down, left
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}, expected one of {', '.join(METHODS)}")
+    if method == 'jump':
+        return simulate_guard_jumps(grid, start_pos)
+    
+    cells = grid.cells
+    outside = grid.fill
+    obstacle = ord('#')
+    
+    # Flat-index offsets: up, right, down, left
+    directions = grid.directions
     direction_idx = 0  # Start facing up
     
-    row, col = start_pos
     visited = set()
     
-    if not is_valid_position(row, col, grid):
+    if not grid.in_bounds(*start_pos):
         return visited
+    index = grid.index(*start_pos)
+    steps = 0
     
     while True:
+        steps += 1
         # Add current position to visited set
-        visited.add((row, col))
+        visited.add(index)
         
         # Calculate next position
-        dr, dc = directions[direction_idx]
-        next_row, next_col = row + dr, col + dc
+        next_index = index + directions[direction_idx]
+        cell = cells[next_index]
         
         # Check if guard would leave the map
-        if not is_valid_position(next_row, next_col, grid):
+        if cell == outside:
             break
         
         # Check if there's an obstacle ahead
-        if has_obstacle(next_row, next_col, grid):
+        if cell == obstacle:
             # Turn right 90 degrees
             direction_idx = (direction_idx + 1) % 4
         else:
             # Move forward
-            row, col = next_row, next_col
+            index = next_index
+    
+    counters.add('guard_steps', steps)
+    return {grid.position(index) for index in visited}
+
+class ObstacleIndex:
+    """Sorted obstacle coordinates per row and per column of a grid.
+    
+    next_stop() finds the next obstacle ahead with one bisect, so a
+    simulation moves from turn to turn instead of cell by cell.
+    Directions are numbered like Grid.directions: up, right, down, left.
+    """
+    
+    def __init__(self, grid):
+        self.rows = grid.rows
+        self.cols = grid.cols
+        self.in_row = [[] for _ in range(grid.rows)]
+        self.in_col = [[] for _ in range(grid.cols)]
+        # find_all scans row by row, so both kinds of list come out sorted
+        for index in grid.find_all('#'):
+            row, col = grid.position(index)
+            self.in_row[row].append(col)
+            self.in_col[col].append(row)
+    
+    def next_stop(self, row, col, direction, extra=None):
+        """Cell where the guard stops in front of the next obstacle, or None if it walks off.
+        
+        `extra` is one more obstacle (row, col) that is not in the grid.
+        """
+        vertical = direction % 2 == 0
+        line, pos = (self.in_col[col], row) if vertical else (self.in_row[row], col)
+        forward = direction in (1, 2)  # right and down move to higher coordinates
+        
+        if forward:
+            i = bisect_right(line, pos)
+            blocker = line[i] if i < len(line) else None
+        else:
+            i = bisect_left(line, pos) - 1
+            blocker = line[i] if i >= 0 else None
+        
+        if extra is not None:
+            extra_line, extra_pos = (extra[1], extra[0]) if vertical else extra
+            if extra_line == (col if vertical else row) and (extra_pos > pos if forward else extra_pos < pos):
+                if blocker is None or (extra_pos < blocker if forward else extra_pos > blocker):
+                    blocker = extra_pos
+        
+        if blocker is None:
+            return None
+        stop = blocker - 1 if forward else blocker + 1
+        return (stop, col) if vertical else (row, stop)
     
-    return visited
+    def edge(self, row, col, direction):
+        """Last cell on the map walking from (row, col) in direction."""
+        return ((0, col), (row, self.cols - 1), (self.rows - 1, col), (row, 0))[direction]
+
+def simulate_guard_jumps(grid, start_pos, obstacles=None):
+    """simulate_guard_path jumping from turn to turn; each leg's cells are added as one range."""
+    obstacles = obstacles or ObstacleIndex(grid)
+    visited = set()
+    
+    if not grid.in_bounds(*start_pos):
+        return set()
+    row, col = start_pos
+    direction = 0  # Start facing up
+    jumps = 0
+    
+    while True:
+        jumps += 1
+        stop = obstacles.next_stop(row, col, direction)
+        end = stop or obstacles.edge(row, col, direction)
+        
+        # The leg's cells are evenly spaced flat indices
+        offset = grid.directions[direction]
+        visited.update(range(grid.index(row, col), grid.index(*end) + offset, offset))
+        
+        if stop is None:
+            break
+        row, col = stop
+        direction = (direction + 1) % 4
+    
+    counters.add('guard_jumps', jumps)
+    return {grid.position(index) for index in visited}
 
 def main():
     # Check command line arguments
     test_mode = '--test' in sys.argv
     debug_mode = '--debug' in sys.argv
     
+    method = 'jump'
+    if '--method' in sys.argv:
+        method_idx = sys.argv.index('--method')
+        if method_idx + 1 < len(sys.argv):
+            method = sys.argv[method_idx + 1]
+    
     filename = 'example.txt' if test_mode else 'input.txt'
     
     if debug_mode:
@@ -79,14 +167,13 @@ def main():
     grid, guard_pos = parse_input(filename)
     
     if debug_mode:
-        print(f"Grid dimensions: {len(grid)}x{len(grid[0])}")
+        print(f"Grid dimensions: {grid.rows}x{grid.cols}")
         print(f"Guard starting position: {guard_pos}")
         print("Grid:")
-        for row in grid:
-            print(''.join(row))
+        print(grid)
         print()
     
-    visited_positions = simulate_guard_path(grid, guard_pos)
+    visited_positions = simulate_guard_path(grid, guard_pos, method)
     result = len(visited_positions)
     
     if debug_mode:
@@ -1,107 +1,191 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import counters
+from common.grid import Grid
+from solution_part1 import METHODS, ObstacleIndex, simulate_guard_jumps
+
+# Where each candidate's loop check begins: the guard's start, or the point
+# where its path first reaches the candidate cell
+LOOP_STARTS = ('start', 'divergence')
+
+# (row, col) steps for the directions up, right, down, left
+STEPS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
 def parse_input(filename):
     """Parse the input file and return grid and guard starting position."""
-    with open(filename, 'r') as f:
-        lines = f.read().strip().split('\n')
-    
-    grid = [list(line) for line in lines]
-    guard_pos = None
+    # Padding cells are ' ' so stepping off the map is a single byte test
+    grid = Grid.from_file(filename, pad=1, fill=' ')
     
     # Find guard starting position (marked with ^)
-    for row in range(len(grid)):
-        for col in range(len(grid[row])):
-            if grid[row][col] == '^':
-                guard_pos = (row, col)
-                grid[row][col] = '.'  # Replace with empty space
-                break
-        if guard_pos:
-            break
-    
-    return grid, guard_pos
-
-def is_valid_position(row, col, grid):
-    """Check if position is within grid boundaries."""
-    return 0 <= row < len(grid) and 0 <= col < len(grid[0])
-
-def has_obstacle(row, col, grid):
-    """Check if position contains an obstacle."""
-    if not is_valid_position(row, col, grid):
-        return False
-    return grid[row][col] == '#'
+    guard_index = grid.find('^')
+    if guard_index < 0:
+        return grid, None
+    grid.cells[guard_index] = ord('.')  # Replace with empty space
+    
+    return grid, grid.position(guard_index)
 
-def simulate_guard_path(grid, start_pos, detect_loops=False):
+def simulate_guard_path(grid, start_pos, detect_loops=False, direction_idx=0):
     """Simulate guard movement. Returns visited positions or detects loops."""
-    # Direction vectors: up, right, down, left
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-    direction_idx = 0  # Start facing up
+    cells = grid.cells
+    outside = grid.fill
+    obstacle = ord('#')
+    
+    # Flat-index offsets: up, right, down, left; the guard starts facing up by default
+    directions = grid.directions
     
-    row, col = start_pos
     visited_positions = set()
-    visited_states = set()  # For loop detection: (row, col, direction)
+    visited_states = set()  # For loop detection: index * 4 + direction
     
-    if not is_valid_position(row, col, grid):
+    if not grid.in_bounds(*start_pos):
         return visited_positions if not detect_loops else False
+    index = grid.index(*start_pos)
+    steps = 0
     
     while True:
-        # Current state for loop detection
-        current_state = (row, col, direction_idx)
-        
+        steps += 1
         if detect_loops:
             # Check if we've been in this state before (loop detected)
+            current_state = index * 4 + direction_idx
             if current_state in visited_states:
+                counters.add('guard_steps', steps)
                 return True  # Loop found
             visited_states.add(current_state)
         else:
             # Just track positions for Part 1
-            visited_positions.add((row, col))
+            visited_positions.add(index)
         
         # Calculate next position
-        dr, dc = directions[direction_idx]
-        next_row, next_col = row + dr, col + dc
+        next_index = index + directions[direction_idx]
+        cell = cells[next_index]
         
         # Check if guard would leave the map
-        if not is_valid_position(next_row, next_col, grid):
+        if cell == outside:
+            counters.add('guard_steps', steps)
             if detect_loops:
                 return False  # No loop, guard exits
             else:
                 break  # Guard exits, simulation complete
         
         # Check if there's an obstacle ahead
-        if has_obstacle(next_row, next_col, grid):
+        if cell == obstacle:
             # Turn right 90 degrees
             direction_idx = (direction_idx + 1) % 4
         else:
             # Move forward
-            row, col = next_row, next_col
+            index = next_index
     
-    return visited_positions if not detect_loops else False
+    return {grid.position(index) for index in visited_positions}
 
 def get_original_path(grid, start_pos):
     """Get the original patrol path (optimization for Part 2)."""
     return simulate_guard_path(grid, start_pos, detect_loops=False)
 
-def test_obstacle_position(grid, start_pos, obstacle_pos):
+def test_obstacle_position(grid, start_pos, obstacle_pos, direction_idx=0):
     """Test if placing obstacle at given position creates a loop."""
     if obstacle_pos == start_pos:
         return False  # Can't place obstacle at starting position
     
     # Temporarily place obstacle
-    original_cell = grid[obstacle_pos[0]][obstacle_pos[1]]
-    grid[obstacle_pos[0]][obstacle_pos[1]] = '#'
+    obstacle_index = grid.index(*obstacle_pos)
+    original_cell = grid.cells[obstacle_index]
+    grid.cells[obstacle_index] = ord('#')
     
     # Test for loop
-    creates_loop = simulate_guard_path(grid, start_pos, detect_loops=True)
+    creates_loop = simulate_guard_path(grid, start_pos, detect_loops=True, direction_idx=direction_idx)
     
     # Restore original cell
-    grid[obstacle_pos[0]][obstacle_pos[1]] = original_cell
+    grid.cells[obstacle_index] = original_cell
     
     return creates_loop
 
-def solve_part2(grid, start_pos):
+def detect_loop_jumps(obstacles, start_pos, extra=None, direction=0):
+    """True if the guard loops, with `extra` as one added obstacle.
+    
+    The guard jumps from turn to turn, and only the turn states are
+    recorded: a loop must repeat one of them.
+    """
+    row, col = start_pos
+    turns = set()
+    jumps = 0
+    
+    while True:
+        jumps += 1
+        stop = obstacles.next_stop(row, col, direction, extra)
+        if stop is None:
+            counters.add('guard_jumps', jumps)
+            return False  # No loop, guard exits
+        
+        state = (stop, direction)
+        if state in turns:
+            counters.add('guard_jumps', jumps)
+            return True  # Loop found
+        turns.add(state)
+        
+        row, col = stop
+        direction = (direction + 1) % 4
+
+def solve_part2_jumps(grid, start_pos):
+    """solve_part2 on the jump table; candidates are virtual obstacles, the grid is never modified."""
+    obstacles = ObstacleIndex(grid)
+    original_path = simulate_guard_jumps(grid, start_pos, obstacles)
+    
+    return {pos for pos in original_path
+            if pos != start_pos and detect_loop_jumps(obstacles, start_pos, pos)}
+
+def solve_part2_divergence(grid, start_pos, method='jump'):
+    """solve_part2 with each loop check resumed where the path first reaches the candidate.
+    
+    The original path is walked once, cell by cell.  Up to the first visit
+    of a cell, an obstacle there changes nothing, so the check for that
+    cell starts from the guard's state one step earlier, facing the new
+    obstacle, instead of re-simulating the whole prefix.  Any loop it runs
+    into repeats a state from after that point.
+    """
+    obstacles = ObstacleIndex(grid)
+    if method == 'jump':
+        creates_loop = lambda pos, direction, candidate: detect_loop_jumps(obstacles, pos, candidate, direction)
+    else:
+        creates_loop = lambda pos, direction, candidate: test_obstacle_position(grid, pos, candidate, direction)
+    loop_positions = set()
+    
+    if not grid.in_bounds(*start_pos):
+        return loop_positions
+    seen = {start_pos}  # The start itself can't take an obstacle
+    row, col = start_pos
+    direction = 0  # Start facing up
+    
+    while True:
+        stop = obstacles.next_stop(row, col, direction)
+        end = stop or obstacles.edge(row, col, direction)
+        dr, dc = STEPS[direction]
+        
+        while (row, col) != end:
+            candidate = (row + dr, col + dc)
+            if candidate not in seen:
+                seen.add(candidate)
+                if creates_loop((row, col), direction, candidate):
+                    loop_positions.add(candidate)
+            row, col = candidate
+        
+        if stop is None:
+            return loop_positions
+        direction = (direction + 1) % 4
+
+def solve_part2(grid, start_pos, method='step', loop_start='start'):
     """Find all positions where adding obstacle creates infinite loop."""
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}, expected one of {', '.join(METHODS)}")
+    if loop_start not in LOOP_STARTS:
+        raise ValueError(f"unknown loop start {loop_start!r}, expected one of {', '.join(LOOP_STARTS)}")
+    if loop_start == 'divergence':
+        return solve_part2_divergence(grid, start_pos, method)
+    if method == 'jump':
+        return solve_part2_jumps(grid, start_pos)
+    
     # Get original path to optimize search space
     original_path = get_original_path(grid, start_pos)
     
@@ -122,6 +206,18 @@ def main():
     test_mode = '--test' in sys.argv
     debug_mode = '--debug' in sys.argv
     
+    method = 'jump'
+    if '--method' in sys.argv:
+        method_idx = sys.argv.index('--method')
+        if method_idx + 1 < len(sys.argv):
+            method = sys.argv[method_idx + 1]
+    
+    loop_start = 'divergence'
+    if '--loop-start' in sys.argv:
+        loop_start_idx = sys.argv.index('--loop-start')
+        if loop_start_idx + 1 < len(sys.argv):
+            loop_start = sys.argv[loop_start_idx + 1]
+    
     filename = 'example.txt' if test_mode else 'input.txt'
     
     if debug_mode:
@@ -130,7 +226,7 @@ def main():
     grid, guard_pos = parse_input(filename)
     
     if debug_mode:
-        print(f"Grid dimensions: {len(grid)}x{len(grid[0])}")
+        print(f"Grid dimensions: {grid.rows}x{grid.cols}")
         print(f"Guard starting position: {guard_pos}")
         print()
     
@@ -142,7 +238,7 @@ def main():
         print("Testing obstacle positions...")
     
     # Find loop-creating obstacle positions
-    loop_positions = solve_part2(grid, guard_pos)
+    loop_positions = solve_part2(grid, guard_pos, method, loop_start)
     result = len(loop_positions)
     
     if debug_mode:
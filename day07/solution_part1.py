@@ -1,24 +1,25 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import counters
+from common.ints import read_int_rows
+
 def parse_input(filename):
     """Parse input file into list of (test_value, numbers) tuples"""
-    equations = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            test_value_str, numbers_str = line.split(': ')
-            test_value = int(test_value_str)
-            numbers = [int(x) for x in numbers_str.split()]
-            equations.append((test_value, numbers))
-    return equations
+    return [(row[0], row[1:]) for row in read_int_rows(filename)]
+
+# Calls made by the current can_be_solved search; reported to counters once per
+# equation so the recursion itself only bumps an int
+recursive_calls = [0]
 
 def can_be_solved_recursive(target, current, remaining_numbers):
     """Recursively check if target can be reached with remaining numbers"""
+    recursive_calls[0] += 1
+    
     # Base case: no more numbers to process
     if not remaining_numbers:
         return current == target
@@ -47,7 +48,10 @@ def can_be_solved(test_value, numbers):
         return test_value == numbers[0]
     
     # Start recursion with first number as current result
-    return can_be_solved_recursive(test_value, numbers[0], numbers[1:])
+    recursive_calls[0] = 0
+    solvable = can_be_solved_recursive(test_value, numbers[0], numbers[1:])
+    counters.add('recursive_calls', recursive_calls[0])
+    return solvable
 
 def solve_part1(filename, debug=False):
     """Main function to solve part 1"""
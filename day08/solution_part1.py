@@ -38,16 +38,8 @@ def is_within_bounds(row, col, grid):
     """Check if position is within grid bounds"""
     return 0 <= row < len(grid) and 0 <= col < len(grid[0])
 
-def solve_part1(filename, debug=False):
-    """Main function to solve part 1"""
-    antennas, grid = parse_input(filename)
-    
-    if debug:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        print(f"Found antennas for frequencies: {list(antennas.keys())}")
-        for freq, positions in antennas.items():
-            print(f"  {freq}: {len(positions)} antennas at {positions}")
-    
+def find_antinodes(antennas, grid, debug=False):
+    """Collect every in-bounds antinode position for all frequencies"""
     antinodes = set()
     
     # Process each frequency separately
@@ -77,6 +69,20 @@ def solve_part1(filename, debug=False):
                 if debug:
                     print(f"    Added antinode: {antinode2}")
     
+    return antinodes
+
+def solve_part1(filename, debug=False):
+    """Main function to solve part 1"""
+    antennas, grid = parse_input(filename)
+    
+    if debug:
+        print(f"Grid size: {len(grid)}x{len(grid[0])}")
+        print(f"Found antennas for frequencies: {list(antennas.keys())}")
+        for freq, positions in antennas.items():
+            print(f"  {freq}: {len(positions)} antennas at {positions}")
+    
+    antinodes = find_antinodes(antennas, grid, debug)
+    
     if debug:
         print(f"\nTotal unique antinodes: {len(antinodes)}")
         if len(antinodes) <= 20:  # Only show if not too many
@@ -23,16 +23,8 @@ def is_within_bounds(row, col, grid):
     """Check if position is within grid bounds"""
     return 0 <= row < len(grid) and 0 <= col < len(grid[0])
 
-def solve_part2(filename, debug=False):
-    """Main function to solve part 2"""
-    antennas, grid = parse_input(filename)
-    
-    if debug:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        print(f"Found antennas for frequencies: {list(antennas.keys())}")
-        for freq, positions in antennas.items():
-            print(f"  {freq}: {len(positions)} antennas at {positions}")
-    
+def find_antinodes(antennas, grid, debug=False):
+    """Collect every in-bounds antinode position for all frequencies"""
     antinodes = set()
     
     # Process each frequency separately
@@ -87,6 +79,20 @@ def solve_part2(filename, debug=False):
             if debug:
                 print(f"    Added {forward_count} forward + {backward_count} backward antinodes")
     
+    return antinodes
+
+def solve_part2(filename, debug=False):
+    """Main function to solve part 2"""
+    antennas, grid = parse_input(filename)
+    
+    if debug:
+        print(f"Grid size: {len(grid)}x{len(grid[0])}")
+        print(f"Found antennas for frequencies: {list(antennas.keys())}")
+        for freq, positions in antennas.items():
+            print(f"  {freq}: {len(positions)} antennas at {positions}")
+    
+    antinodes = find_antinodes(antennas, grid, debug)
+    
     if debug:
         print(f"\nTotal unique antinodes: {len(antinodes)}")
         if len(antinodes) <= 50:  # Only show if not too many
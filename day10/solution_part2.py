@@ -1,36 +1,29 @@
 #!/usr/bin/env python3
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.grid import Grid
+
 def parse_input(filename):
-    """Parse the topographic map from input file and return 2D grid."""
-    grid = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                row = [int(char) for char in line]
-                grid.append(row)
-    return grid
+    """Parse the topographic map into a grid of digit characters padded with ' '."""
+    return Grid.from_file(filename, pad=1, fill=' ')
 
 def find_trailheads(grid):
     """Find all positions with height 0 (trailheads)."""
-    trailheads = []
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == 0:
-                trailheads.append((row, col))
-    return trailheads
+    return [grid.position(index) for index in grid.find_all('0')]
 
 def calculate_all_trailhead_ratings(grid, trailheads, debug=False):
     """Use layer-by-layer propagation to count distinct trails from each trailhead."""
-    rows, cols = len(grid), len(grid[0])
+    cells = grid.cells
+    directions = grid.directions
     
-    # For each trailhead, track number of distinct paths to each position
+    # For each trailhead, track number of distinct paths to each flat index
     trailhead_paths = {}
     for i, (tr_row, tr_col) in enumerate(trailheads):
         trailhead_paths[i] = {}
         # Initialize: 1 path to the trailhead itself
-        trailhead_paths[i][(tr_row, tr_col)] = 1
+        trailhead_paths[i][grid.index(tr_row, tr_col)] = 1
     
     if debug:
         print(f"Starting path counting for {len(trailheads)} trailheads")
@@ -42,49 +35,44 @@ def calculate_all_trailhead_ratings(grid, trailheads, debug=False):
         if debug:
             print(f"  Processing height {target_height}")
         
+        previous_height = ord(str(target_height - 1))
         new_paths = {}
         for trailhead_idx in trailhead_paths:
             new_paths[trailhead_idx] = {}
         
         # For each position at current height, count paths from previous height
-        for row in range(rows):
-            for col in range(cols):
-                if grid[row][col] == target_height:
-                    # Check all 4 neighbors for previous height
-                    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-                    
-                    for dr, dc in directions:
-                        prev_row, prev_col = row + dr, col + dc
-                        
-                        # Check bounds and height
-                        if (0 <= prev_row < rows and 
-                            0 <= prev_col < cols and
-                            grid[prev_row][prev_col] == target_height - 1):
+        for index in grid.find_all(str(target_height)):
+            # Check all 4 neighbors for previous height; padding never matches
+            for offset in directions:
+                prev_index = index + offset
+                
+                if cells[prev_index] == previous_height:
+                    # For each trailhead, add paths from previous position
+                    for trailhead_idx, path_counts in trailhead_paths.items():
+                        if prev_index in path_counts:
+                            # Add the number of paths from previous position
+                            if index not in new_paths[trailhead_idx]:
+                                new_paths[trailhead_idx][index] = 0
+                            new_paths[trailhead_idx][index] += path_counts[prev_index]
                             
-                            # For each trailhead, add paths from previous position
-                            for trailhead_idx, path_counts in trailhead_paths.items():
-                                if (prev_row, prev_col) in path_counts:
-                                    # Add the number of paths from previous position
-                                    if (row, col) not in new_paths[trailhead_idx]:
-                                        new_paths[trailhead_idx][(row, col)] = 0
-                                    new_paths[trailhead_idx][(row, col)] += path_counts[(prev_row, prev_col)]
-                                    
-                                    if debug and target_height == 9:
-                                        tr_row, tr_col = trailheads[trailhead_idx]
-                                        print(f"    Trailhead ({tr_row}, {tr_col}) has {new_paths[trailhead_idx][(row, col)]} paths to 9 at ({row}, {col})")
+                            if debug and target_height == 9:
+                                tr_row, tr_col = trailheads[trailhead_idx]
+                                print(f"    Trailhead ({tr_row}, {tr_col}) has {new_paths[trailhead_idx][index]} paths to 9 at {grid.position(index)}")
         
         # Update path counts with new positions
         for trailhead_idx in trailhead_paths:
             trailhead_paths[trailhead_idx].update(new_paths[trailhead_idx])
     
     # Calculate ratings (sum of distinct trails to all 9s for each trailhead)
+    nine = ord('9')
     ratings = []
     for trailhead_idx, (tr_row, tr_col) in enumerate(trailheads):
         rating = 0
         trail_count_details = []
         
-        for (row, col), path_count in trailhead_paths[trailhead_idx].items():
-            if grid[row][col] == 9:
+        for index, path_count in trailhead_paths[trailhead_idx].items():
+            if cells[index] == nine:
+                row, col = grid.position(index)
                 rating += path_count
                 trail_count_details.append(f"{path_count} to ({row},{col})")
         
@@ -111,10 +99,10 @@ def main():
     # Parse input and build grid
     grid = parse_input(filename)
     if debug_mode:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
+        print(f"Grid size: {grid.rows}x{grid.cols}")
         print("Grid:")
-        for i, row in enumerate(grid):
-            print(f"  {i:2}: {''.join(str(x) for x in row)}")
+        for i in range(grid.rows):
+            print(f"  {i:2}: {grid.row_text(i)}")
     
     # Find all trailheads
     trailheads = find_trailheads(grid)
@@ -1,102 +1,81 @@
 #!/usr/bin/env python3
+import os
 import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.grid import Grid
+
 def parse_input(filename):
-    """Parse the garden grid from input file."""
-    grid = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                grid.append(list(line))
-    return grid
+    """Parse the garden grid from input file, padded with '.' which is never a plant."""
+    return Grid.from_file(filename, pad=1, fill='.')
 
-def get_neighbors(row, col, grid):
-    """Get valid adjacent cells (4-directional)."""
-    neighbors = []
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # up, down, left, right
-    
-    for dr, dc in directions:
-        new_row, new_col = row + dr, col + dc
-        if (0 <= new_row < len(grid) and 
-            0 <= new_col < len(grid[0])):
-            neighbors.append((new_row, new_col))
-    
-    return neighbors
+def get_neighbors(index, grid):
+    """Get flat indices of adjacent cells (4-directional); padding needs no bounds check."""
+    return [index + offset for offset in grid.directions]
 
-def flood_fill(start_row, start_col, grid, visited):
-    """Use BFS to find all cells in the connected region."""
-    plant_type = grid[start_row][start_col]
+def flood_fill(start_index, grid, visited):
+    """Use BFS to find the flat indices of all cells in the connected region."""
+    cells = grid.cells
+    plant_type = cells[start_index]
     region_cells = []
-    queue = deque([(start_row, start_col)])
-    visited[start_row][start_col] = True
+    queue = deque([start_index])
+    visited[start_index] = True
     
     while queue:
-        row, col = queue.popleft()
-        region_cells.append((row, col))
+        index = queue.popleft()
+        region_cells.append(index)
         
         # Check all neighbors
-        for nr, nc in get_neighbors(row, col, grid):
-            if (not visited[nr][nc] and 
-                grid[nr][nc] == plant_type):
-                visited[nr][nc] = True
-                queue.append((nr, nc))
+        for neighbor in get_neighbors(index, grid):
+            if (not visited[neighbor] and 
+                cells[neighbor] == plant_type):
+                visited[neighbor] = True
+                queue.append(neighbor)
     
     return region_cells
 
 def calculate_perimeter(region_cells, grid):
     """Calculate perimeter by counting edges that don't touch same-type neighbors."""
+    cells = grid.cells
     perimeter = 0
-    plant_type = grid[region_cells[0][0]][region_cells[0][1]]
-    
-    # Convert region_cells to set for O(1) lookup
-    region_set = set(region_cells)
+    plant_type = cells[region_cells[0]]
     
-    for row, col in region_cells:
+    for index in region_cells:
         # Check all 4 directions for this cell
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        for dr, dc in directions:
-            nr, nc = row + dr, col + dc
-            
-            # Edge contributes to perimeter if:
-            # 1. Neighbor is out of bounds, OR
-            # 2. Neighbor is different plant type
-            if (nr < 0 or nr >= len(grid) or 
-                nc < 0 or nc >= len(grid[0]) or
-                (nr, nc) not in region_set):
+        for offset in grid.directions:
+            # Edge contributes to perimeter if the neighbor is padding or a
+            # different plant type (same-type neighbors are always in the region)
+            if cells[index + offset] != plant_type:
                 perimeter += 1
     
     return perimeter
 
 def find_all_regions(grid, debug=False):
     """Find all connected regions in the grid."""
-    rows, cols = len(grid), len(grid[0])
-    visited = [[False] * cols for _ in range(rows)]
+    visited = bytearray(len(grid.cells))
     regions = []
     
-    for row in range(rows):
-        for col in range(cols):
-            if not visited[row][col]:
-                # Found a new region
-                region_cells = flood_fill(row, col, grid, visited)
-                plant_type = grid[row][col]
-                area = len(region_cells)
-                perimeter = calculate_perimeter(region_cells, grid)
-                cost = area * perimeter
-                
-                region_info = {
-                    'plant_type': plant_type,
-                    'cells': region_cells,
-                    'area': area,
-                    'perimeter': perimeter,
-                    'cost': cost
-                }
-                regions.append(region_info)
-                
-                if debug:
-                    print(f"Region {plant_type}: area={area}, perimeter={perimeter}, cost={cost}")
+    for index in grid.interior():
+        if not visited[index]:
+            # Found a new region
+            region_cells = flood_fill(index, grid, visited)
+            plant_type = chr(grid.cells[index])
+            area = len(region_cells)
+            perimeter = calculate_perimeter(region_cells, grid)
+            cost = area * perimeter
+            
+            region_info = {
+                'plant_type': plant_type,
+                'cells': region_cells,
+                'area': area,
+                'perimeter': perimeter,
+                'cost': cost
+            }
+            regions.append(region_info)
+            
+            if debug:
+                print(f"Region {plant_type}: area={area}, perimeter={perimeter}, cost={cost}")
     
     return regions
 
@@ -114,11 +93,11 @@ def main():
     # Parse input
     grid = parse_input(filename)
     if debug_mode:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        if len(grid) <= 10:  # Show small grids
+        print(f"Grid size: {grid.rows}x{grid.cols}")
+        if grid.rows <= 10:  # Show small grids
             print("Grid:")
-            for i, row in enumerate(grid):
-                print(f"  {i:2}: {''.join(row)}")
+            for i in range(grid.rows):
+                print(f"  {i:2}: {grid.row_text(i)}")
     
     # Find all regions
     regions = find_all_regions(grid, debug_mode)
@@ -1,47 +1,37 @@
 #!/usr/bin/env python3
+import os
 import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.grid import Grid
+
 def parse_input(filename):
-    """Parse the garden grid from input file."""
-    grid = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                grid.append(list(line))
-    return grid
+    """Parse the garden grid from input file, padded with '.' which is never a plant."""
+    return Grid.from_file(filename, pad=1, fill='.')
 
-def get_neighbors(row, col, grid):
-    """Get valid adjacent cells (4-directional)."""
-    neighbors = []
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # up, down, left, right
-    
-    for dr, dc in directions:
-        new_row, new_col = row + dr, col + dc
-        if (0 <= new_row < len(grid) and 
-            0 <= new_col < len(grid[0])):
-            neighbors.append((new_row, new_col))
-    
-    return neighbors
+def get_neighbors(index, grid):
+    """Get flat indices of adjacent cells (4-directional); padding needs no bounds check."""
+    return [index + offset for offset in grid.directions]
 
-def flood_fill(start_row, start_col, grid, visited):
-    """Use BFS to find all cells in the connected region."""
-    plant_type = grid[start_row][start_col]
+def flood_fill(start_index, grid, visited):
+    """Use BFS to find the flat indices of all cells in the connected region."""
+    cells = grid.cells
+    plant_type = cells[start_index]
     region_cells = []
-    queue = deque([(start_row, start_col)])
-    visited[start_row][start_col] = True
+    queue = deque([start_index])
+    visited[start_index] = True
     
     while queue:
-        row, col = queue.popleft()
-        region_cells.append((row, col))
+        index = queue.popleft()
+        region_cells.append(index)
         
         # Check all neighbors
-        for nr, nc in get_neighbors(row, col, grid):
-            if (not visited[nr][nc] and 
-                grid[nr][nc] == plant_type):
-                visited[nr][nc] = True
-                queue.append((nr, nc))
+        for neighbor in get_neighbors(index, grid):
+            if (not visited[neighbor] and 
+                cells[neighbor] == plant_type):
+                visited[neighbor] = True
+                queue.append(neighbor)
     
     return region_cells
 
@@ -50,28 +40,22 @@ def count_sides(region_cells, grid):
     if not region_cells:
         return 0
     
-    region_set = set(region_cells)
-    plant_type = grid[region_cells[0][0]][region_cells[0][1]]
+    cells = grid.cells
+    plant_type = cells[region_cells[0]]
     
     # Find all boundary edges
-    # Each edge is represented as ((cell_row, cell_col), direction)
+    # Each edge is represented as (cell_index, direction_index)
     # where direction indicates which side of the cell the edge is on
     boundary_edges = set()
     
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # up, down, left, right
-    dir_names = ['up', 'down', 'left', 'right']
+    directions = grid.directions  # up, right, down, left
     
-    for row, col in region_cells:
-        for i, (dr, dc) in enumerate(directions):
-            nr, nc = row + dr, col + dc
-            
-            # This edge is part of the boundary if the neighbor is:
-            # 1. Out of bounds, OR
-            # 2. Not part of this region
-            if (nr < 0 or nr >= len(grid) or 
-                nc < 0 or nc >= len(grid[0]) or
-                (nr, nc) not in region_set):
-                boundary_edges.add(((row, col), dir_names[i]))
+    for index in region_cells:
+        for i, offset in enumerate(directions):
+            # This edge is part of the boundary if the neighbor is padding
+            # or not part of this region (i.e. a different plant type)
+            if cells[index + offset] != plant_type:
+                boundary_edges.add((index, i))
     
     # Now group boundary edges into contiguous sides
     # Two edges belong to the same side if they are:
@@ -93,57 +77,45 @@ def count_sides(region_cells, grid):
         visited_edges.add(edge)
         
         while queue:
-            current_edge = queue.popleft()
-            (row, col), direction = current_edge
-            
-            # Find adjacent edges in the same direction
-            if direction in ['up', 'down']:
-                # For horizontal edges, check left and right neighbors
-                for dc in [-1, 1]:
-                    adjacent_edge = ((row, col + dc), direction)
-                    if (adjacent_edge in boundary_edges and 
-                        adjacent_edge not in visited_edges):
-                        visited_edges.add(adjacent_edge)
-                        queue.append(adjacent_edge)
+            index, direction = queue.popleft()
             
-            elif direction in ['left', 'right']:
-                # For vertical edges, check up and down neighbors
-                for dr in [-1, 1]:
-                    adjacent_edge = ((row + dr, col), direction)
-                    if (adjacent_edge in boundary_edges and 
-                        adjacent_edge not in visited_edges):
-                        visited_edges.add(adjacent_edge)
-                        queue.append(adjacent_edge)
+            # Up/down edges run horizontally, so their neighbors are left and
+            # right; left/right edges run vertically
+            step = grid.right if direction in (0, 2) else grid.down
+            for adjacent_index in (index - step, index + step):
+                adjacent_edge = (adjacent_index, direction)
+                if (adjacent_edge in boundary_edges and 
+                    adjacent_edge not in visited_edges):
+                    visited_edges.add(adjacent_edge)
+                    queue.append(adjacent_edge)
     
     return sides_count
 
 def find_all_regions(grid, debug=False):
     """Find all connected regions in the grid."""
-    rows, cols = len(grid), len(grid[0])
-    visited = [[False] * cols for _ in range(rows)]
+    visited = bytearray(len(grid.cells))
     regions = []
     
-    for row in range(rows):
-        for col in range(cols):
-            if not visited[row][col]:
-                # Found a new region
-                region_cells = flood_fill(row, col, grid, visited)
-                plant_type = grid[row][col]
-                area = len(region_cells)
-                sides = count_sides(region_cells, grid)
-                cost = area * sides
-                
-                region_info = {
-                    'plant_type': plant_type,
-                    'cells': region_cells,
-                    'area': area,
-                    'sides': sides,
-                    'cost': cost
-                }
-                regions.append(region_info)
-                
-                if debug:
-                    print(f"Region {plant_type}: area={area}, sides={sides}, cost={cost}")
+    for index in grid.interior():
+        if not visited[index]:
+            # Found a new region
+            region_cells = flood_fill(index, grid, visited)
+            plant_type = chr(grid.cells[index])
+            area = len(region_cells)
+            sides = count_sides(region_cells, grid)
+            cost = area * sides
+            
+            region_info = {
+                'plant_type': plant_type,
+                'cells': region_cells,
+                'area': area,
+                'sides': sides,
+                'cost': cost
+            }
+            regions.append(region_info)
+            
+            if debug:
+                print(f"Region {plant_type}: area={area}, sides={sides}, cost={cost}")
     
     return regions
 
@@ -161,11 +133,11 @@ def main():
     # Parse input
     grid = parse_input(filename)
     if debug_mode:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        if len(grid) <= 10:  # Show small grids
+        print(f"Grid size: {grid.rows}x{grid.cols}")
+        if grid.rows <= 10:  # Show small grids
             print("Grid:")
-            for i, row in enumerate(grid):
-                print(f"  {i:2}: {''.join(row)}")
+            for i in range(grid.rows):
+                print(f"  {i:2}: {grid.row_text(i)}")
     
     # Find all regions
     regions = find_all_regions(grid, debug_mode)
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
+import os
+import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.ints import read_int_columns
+
 class Machine:
     def __init__(self, ax, ay, bx, by, px, py):
         self.ax = ax
@@ -11,31 +16,8 @@ class Machine:
         self.py = py
 
 def parse_input(filename):
-    machines = []
-    with open(filename, 'r') as f:
-        lines = [line.strip() for line in f.readlines() if line.strip()]
-    
-    i = 0
-    while i < len(lines):
-        # Parse Button A
-        a_line = lines[i]
-        ax = int(a_line.split('X+')[1].split(',')[0])
-        ay = int(a_line.split('Y+')[1])
-        
-        # Parse Button B
-        b_line = lines[i + 1]
-        bx = int(b_line.split('X+')[1].split(',')[0])
-        by = int(b_line.split('Y+')[1])
-        
-        # Parse Prize
-        p_line = lines[i + 2]
-        px = int(p_line.split('X=')[1].split(',')[0])
-        py = int(p_line.split('Y=')[1])
-        
-        machines.append(Machine(ax, ay, bx, by, px, py))
-        i += 3
-    
-    return machines
+    columns = read_int_columns(filename, 6)
+    return [Machine(*values) for values in zip(*columns)]
 
 def solve_machine(machine, debug=False):
     # Solve linear system using Cramer's rule:
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
+import os
+import sys
 import argparse
+from array import array
 import time
 from typing import List, Tuple
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.ints import read_int_columns
+
 class Robot:
     def __init__(self, x, y, vx, vy):
         self.x = x
@@ -13,25 +19,12 @@ class Robot:
     def __repr__(self):
         return f"Robot(x={self.x}, y={self.y}, vx={self.vx}, vy={self.vy})"
 
+def parse_columns(filename: str) -> Tuple[array, array, array, array]:
+    """Robot positions and velocities as (x, y, vx, vy) columns"""
+    return read_int_columns(filename, 4)
+
 def parse_input(filename: str) -> List[Robot]:
-    robots = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Parse p=x,y v=vx,vy
-            parts = line.split(' ')
-            pos_part = parts[0][2:]  # Remove 'p='
-            vel_part = parts[1][2:]  # Remove 'v='
-            
-            x, y = map(int, pos_part.split(','))
-            vx, vy = map(int, vel_part.split(','))
-            
-            robots.append(Robot(x, y, vx, vy))
-    
-    return robots
+    return [Robot(x, y, vx, vy) for x, y, vx, vy in zip(*parse_columns(filename))]
 
 def simulate_direct(robots: List[Robot], width: int, height: int, time_steps: int) -> List[Robot]:
     """Direct calculation using modular arithmetic"""
@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
+import os
+import sys
 import argparse
-from typing import List
+from array import array
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.ints import read_int_columns
 
 class Robot:
     def __init__(self, x, y, vx, vy):
@@ -12,25 +18,12 @@ class Robot:
     def __repr__(self):
         return f"Robot(x={self.x}, y={self.y}, vx={self.vx}, vy={self.vy})"
 
+def parse_columns(filename: str) -> Tuple[array, array, array, array]:
+    """Robot positions and velocities as (x, y, vx, vy) columns"""
+    return read_int_columns(filename, 4)
+
 def parse_input(filename: str) -> List[Robot]:
-    robots = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Parse p=x,y v=vx,vy
-            parts = line.split(' ')
-            pos_part = parts[0][2:]  # Remove 'p='
-            vel_part = parts[1][2:]  # Remove 'v='
-            
-            x, y = map(int, pos_part.split(','))
-            vx, vy = map(int, vel_part.split(','))
-            
-            robots.append(Robot(x, y, vx, vy))
-    
-    return robots
+    return [Robot(x, y, vx, vy) for x, y, vx, vy in zip(*parse_columns(filename))]
 
 def simulate_to_time(robots: List[Robot], width: int, height: int, time_step: int) -> List[Robot]:
     """Calculate robot positions at specific time step"""
@@ -75,6 +68,27 @@ def calculate_clustering_score(robots: List[Robot]) -> float:
     variance = sum((r.x - mean_x)**2 + (r.y - mean_y)**2 for r in robots) / len(robots)
     return variance
 
+def axis_variance(positions: List[int]) -> float:
+    """Variance of robot positions along a single axis"""
+    mean = sum(positions) / len(positions)
+    return sum((p - mean)**2 for p in positions) / len(positions)
+
+def find_easter_egg_time(robots: List[Robot], width: int, height: int) -> int:
+    """Find the time step where the robots are most clustered.
+    
+    X positions repeat every `width` steps and Y positions every `height` steps,
+    so each axis is minimised independently and the two residues are combined
+    with the Chinese remainder theorem (width and height are coprime).
+    """
+    best_x = min(range(width),
+                 key=lambda t: axis_variance([(r.x + r.vx * t) % width for r in robots]))
+    best_y = min(range(height),
+                 key=lambda t: axis_variance([(r.y + r.vy * t) % height for r in robots]))
+    
+    # t = best_x (mod width) and t = best_y (mod height)
+    k = (best_y - best_x) * pow(width, -1, height) % height
+    return best_x + k * width
+
 def main():
     parser = argparse.ArgumentParser(description='Day 14: Restroom Redoubt Part 2')
     parser.add_argument('--test', action='store_true', help='Run on example.txt')
@@ -82,6 +96,7 @@ def main():
     parser.add_argument('--end', type=int, default=100, help='End time step')
     parser.add_argument('--step', type=int, default=1, help='Time step increment')
     parser.add_argument('--show-scores', action='store_true', help='Show clustering scores only')
+    parser.add_argument('--find', action='store_true', help='Find the most clustered time step directly')
     
     args = parser.parse_args()
     
@@ -91,6 +106,10 @@ def main():
     
     robots = parse_input(filename)
     
+    if args.find:
+        print(find_easter_egg_time(robots, width, height))
+        return
+    
     print(f"Loaded {len(robots)} robots from {filename}")
     print(f"Grid size: {width}×{height}")
     print(f"Showing frames from {args.start} to {args.end}\n")
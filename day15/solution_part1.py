@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.grid import Grid
+
 def parse_input(filename):
     with open(filename, 'r') as f:
         content = f.read().strip()
@@ -11,95 +15,81 @@ def parse_input(filename):
     grid_lines = parts[0].split('\n')
     moves = ''.join(parts[1].split('\n'))
     
-    grid = [list(line) for line in grid_lines]
+    grid = Grid(grid_lines, pad=1, fill='#')
     return grid, moves
 
-def find_robot(grid):
-    for r in range(len(grid)):
-        for c in range(len(grid[0])):
-            if grid[r][c] == '@':
-                return (r, c)
-    return None
-
-def get_direction(move):
+def get_direction(grid, move):
     directions = {
-        '^': (-1, 0),
-        'v': (1, 0),
-        '<': (0, -1),
-        '>': (0, 1)
+        '^': grid.up,
+        'v': grid.down,
+        '<': grid.left,
+        '>': grid.right
     }
     return directions[move]
 
-def can_move_and_push(grid, pos, direction, debug=False):
-    r, c = pos
-    dr, dc = direction
-    new_r, new_c = r + dr, c + dc
-    
-    if new_r < 0 or new_r >= len(grid) or new_c < 0 or new_c >= len(grid[0]):
-        return False
+def can_move_and_push(grid, index, direction, debug=False):
+    # The warehouse is padded with walls, so no bounds check is needed
+    new_index = index + direction
+    cell = grid.cells[new_index]
     
-    if grid[new_r][new_c] == '#':
+    if cell == ord('#'):
         return False
     
-    if grid[new_r][new_c] == '.':
+    if cell == ord('.'):
         return True
     
-    if grid[new_r][new_c] == 'O':
-        return can_move_and_push(grid, (new_r, new_c), direction, debug)
+    if cell == ord('O'):
+        return can_move_and_push(grid, new_index, direction, debug)
     
     return False
 
-def execute_move(grid, robot_pos, direction, debug=False):
-    r, c = robot_pos
-    dr, dc = direction
+def execute_move(grid, robot_index, direction, debug=False):
+    cells = grid.cells
     
-    if not can_move_and_push(grid, robot_pos, direction, debug):
+    if not can_move_and_push(grid, robot_index, direction, debug):
         if debug:
-            print(f"  Cannot move from ({r},{c}) in direction ({dr},{dc})")
-        return robot_pos
+            print(f"  Cannot move from {grid.position(robot_index)} by offset {direction}")
+        return robot_index
     
-    new_r, new_c = r + dr, c + dc
+    new_index = robot_index + direction
     
-    if grid[new_r][new_c] == 'O':
-        push_boxes(grid, (new_r, new_c), direction, debug)
+    if cells[new_index] == ord('O'):
+        push_boxes(grid, new_index, direction, debug)
     
-    grid[r][c] = '.'
-    grid[new_r][new_c] = '@'
+    cells[robot_index] = ord('.')
+    cells[new_index] = ord('@')
     
     if debug:
-        print(f"  Robot moved from ({r},{c}) to ({new_r},{new_c})")
+        print(f"  Robot moved from {grid.position(robot_index)} to {grid.position(new_index)}")
     
-    return (new_r, new_c)
+    return new_index
 
-def push_boxes(grid, box_pos, direction, debug=False):
-    r, c = box_pos
-    dr, dc = direction
-    new_r, new_c = r + dr, c + dc
+def push_boxes(grid, box_index, direction, debug=False):
+    cells = grid.cells
+    new_index = box_index + direction
     
-    if grid[new_r][new_c] == 'O':
-        push_boxes(grid, (new_r, new_c), direction, debug)
+    if cells[new_index] == ord('O'):
+        push_boxes(grid, new_index, direction, debug)
     
-    grid[new_r][new_c] = 'O'
-    grid[r][c] = '.'
+    cells[new_index] = ord('O')
+    cells[box_index] = ord('.')
     
     if debug:
-        print(f"    Box pushed from ({r},{c}) to ({new_r},{new_c})")
+        print(f"    Box pushed from {grid.position(box_index)} to {grid.position(new_index)}")
 
 def calculate_gps_sum(grid):
     total = 0
-    for r in range(len(grid)):
-        for c in range(len(grid[0])):
-            if grid[r][c] == 'O':
-                gps = 100 * r + c
-                total += gps
+    for index in grid.find_all('O'):
+        r, c = grid.position(index)
+        gps = 100 * r + c
+        total += gps
     return total
 
 def print_grid(grid):
-    for row in grid:
-        print(''.join(row))
+    print(grid)
     print()
 
-def simulate_warehouse(grid, moves, robot_pos, debug=False):
+def simulate_warehouse(grid, moves, robot_index, debug=False):
     if debug:
         print("Initial state:")
         print_grid(grid)
@@ -108,13 +98,13 @@ def simulate_warehouse(grid, moves, robot_pos, debug=False):
         if debug:
             print(f"Move {i+1}: {move}")
         
-        direction = get_direction(move)
-        robot_pos = execute_move(grid, robot_pos, direction, debug)
+        direction = get_direction(grid, move)
+        robot_index = execute_move(grid, robot_index, direction, debug)
         
         if debug:
             print_grid(grid)
     
-    return robot_pos
+    return robot_index
 
 def main():
     parser = argparse.ArgumentParser(description='Day 15: Warehouse Woes - Part 1')
@@ -126,12 +116,12 @@ def main():
     debug = args.debug or args.test
     
     grid, moves = parse_input(filename)
-    robot_pos = find_robot(grid)
+    robot_pos = grid.find('@')
     
     if debug:
         print(f"Using input file: {filename}")
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        print(f"Robot starting position: {robot_pos}")
+        print(f"Grid size: {grid.rows}x{grid.cols}")
+        print(f"Robot starting position: {grid.position(robot_pos)}")
         print(f"Number of moves: {len(moves)}")
         print()
     
@@ -139,7 +129,7 @@ def main():
     gps_sum = calculate_gps_sum(grid)
     
     if debug:
-        print(f"Final robot position: {final_robot_pos}")
+        print(f"Final robot position: {grid.position(final_robot_pos)}")
         print("Final state:")
         print_grid(grid)
     
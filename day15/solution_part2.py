@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.grid import Grid
+
 def parse_input(filename):
     with open(filename, 'r') as f:
         content = f.read().strip()
@@ -11,70 +15,53 @@ def parse_input(filename):
     grid_lines = parts[0].split('\n')
     moves = ''.join(parts[1].split('\n'))
     
-    grid = [list(line) for line in grid_lines]
+    grid = Grid(grid_lines, pad=1, fill='#')
     return grid, moves
 
 def scale_grid(grid):
+    widen = {'#': '##', 'O': '[]', '.': '..', '@': '@.'}
     scaled = []
-    for row in grid:
-        new_row = []
-        for cell in row:
-            if cell == '#':
-                new_row.extend(['#', '#'])
-            elif cell == 'O':
-                new_row.extend(['[', ']'])
-            elif cell == '.':
-                new_row.extend(['.', '.'])
-            elif cell == '@':
-                new_row.extend(['@', '.'])
-        scaled.append(new_row)
-    return scaled
-
-def find_robot(grid):
-    for r in range(len(grid)):
-        for c in range(len(grid[0])):
-            if grid[r][c] == '@':
-                return (r, c)
-    return None
+    for r in range(grid.rows):
+        scaled.append(''.join(widen[cell] for cell in grid.row_text(r)))
+    return Grid(scaled, pad=1, fill='#')
 
-def get_direction(move):
+def get_direction(grid, move):
     directions = {
-        '^': (-1, 0),
-        'v': (1, 0),
-        '<': (0, -1),
-        '>': (0, 1)
+        '^': grid.up,
+        'v': grid.down,
+        '<': grid.left,
+        '>': grid.right
     }
     return directions[move]
 
-def get_boxes_to_move(grid, start_pos, direction, debug=False):
+def get_boxes_to_move(grid, start_index, direction, debug=False):
+    cells = grid.cells
     boxes_to_move = set()
-    queue = [start_pos]
+    queue = [start_index]
     
     while queue:
-        r, c = queue.pop(0)
-        dr, dc = direction
-        new_r, new_c = r + dr, c + dc
-        
-        if new_r < 0 or new_r >= len(grid) or new_c < 0 or new_c >= len(grid[0]):
-            return None
+        index = queue.pop(0)
+        new_index = index + direction
+        cell = cells[new_index]
         
-        if grid[new_r][new_c] == '#':
+        # The warehouse is padded with walls, so no bounds check is needed
+        if cell == ord('#'):
             return None
         
-        if grid[new_r][new_c] == '.':
+        if cell == ord('.'):
             continue
         
-        if grid[new_r][new_c] == '[':
-            box_left = (new_r, new_c)
-            box_right = (new_r, new_c + 1)
+        if cell == ord('['):
+            box_left = new_index
+            box_right = new_index + 1
             if box_left not in boxes_to_move:
                 boxes_to_move.add(box_left)
                 boxes_to_move.add(box_right)
                 queue.append(box_left)
                 queue.append(box_right)
-        elif grid[new_r][new_c] == ']':
-            box_left = (new_r, new_c - 1)
-            box_right = (new_r, new_c)
+        elif cell == ord(']'):
+            box_left = new_index - 1
+            box_right = new_index
             if box_left not in boxes_to_move:
                 boxes_to_move.add(box_left)
                 boxes_to_move.add(box_right)
@@ -83,56 +70,52 @@ def get_boxes_to_move(grid, start_pos, direction, debug=False):
     
     return boxes_to_move
 
-def can_move_wide(grid, robot_pos, direction, debug=False):
-    boxes_to_move = get_boxes_to_move(grid, robot_pos, direction, debug)
+def can_move_wide(grid, robot_index, direction, debug=False):
+    boxes_to_move = get_boxes_to_move(grid, robot_index, direction, debug)
     return boxes_to_move is not None
 
-def execute_wide_move(grid, robot_pos, direction, debug=False):
-    r, c = robot_pos
-    dr, dc = direction
+def execute_wide_move(grid, robot_index, direction, debug=False):
+    cells = grid.cells
     
-    boxes_to_move = get_boxes_to_move(grid, robot_pos, direction, debug)
+    boxes_to_move = get_boxes_to_move(grid, robot_index, direction, debug)
     if boxes_to_move is None:
         if debug:
-            print(f"  Cannot move from ({r},{c}) in direction ({dr},{dc})")
-        return robot_pos
+            print(f"  Cannot move from {grid.position(robot_index)} by offset {direction}")
+        return robot_index
     
     if debug and boxes_to_move:
         print(f"  Moving {len(boxes_to_move)//2} boxes")
     
     box_chars = {}
-    for box_r, box_c in boxes_to_move:
-        box_chars[(box_r, box_c)] = grid[box_r][box_c]
-        grid[box_r][box_c] = '.'
+    for box_index in boxes_to_move:
+        box_chars[box_index] = cells[box_index]
+        cells[box_index] = ord('.')
     
-    for (box_r, box_c), char in box_chars.items():
-        new_box_r, new_box_c = box_r + dr, box_c + dc
-        grid[new_box_r][new_box_c] = char
+    for box_index, char in box_chars.items():
+        cells[box_index + direction] = char
     
-    grid[r][c] = '.'
-    new_r, new_c = r + dr, c + dc
-    grid[new_r][new_c] = '@'
+    cells[robot_index] = ord('.')
+    new_index = robot_index + direction
+    cells[new_index] = ord('@')
     
     if debug:
-        print(f"  Robot moved from ({r},{c}) to ({new_r},{new_c})")
+        print(f"  Robot moved from {grid.position(robot_index)} to {grid.position(new_index)}")
     
-    return (new_r, new_c)
+    return new_index
 
 def calculate_wide_gps_sum(grid):
     total = 0
-    for r in range(len(grid)):
-        for c in range(len(grid[0])):
-            if grid[r][c] == '[':
-                gps = 100 * r + c
-                total += gps
+    for index in grid.find_all('['):
+        r, c = grid.position(index)
+        gps = 100 * r + c
+        total += gps
     return total
 
 def print_grid(grid):
-    for row in grid:
-        print(''.join(row))
+    print(grid)
     print()
 
-def simulate_wide_warehouse(grid, moves, robot_pos, debug=False):
+def simulate_wide_warehouse(grid, moves, robot_index, debug=False):
     if debug:
         print("Initial state:")
         print_grid(grid)
@@ -141,13 +124,13 @@ def simulate_wide_warehouse(grid, moves, robot_pos, debug=False):
         if debug:
             print(f"Move {i+1}: {move}")
         
-        direction = get_direction(move)
-        robot_pos = execute_wide_move(grid, robot_pos, direction, debug)
+        direction = get_direction(grid, move)
+        robot_index = execute_wide_move(grid, robot_index, direction, debug)
         
         if debug:
             print_grid(grid)
     
-    return robot_pos
+    return robot_index
 
 def main():
     parser = argparse.ArgumentParser(description='Day 15: Warehouse Woes - Part 2')
@@ -170,13 +153,13 @@ def main():
     
     original_grid, moves = parse_input(filename)
     grid = scale_grid(original_grid)
-    robot_pos = find_robot(grid)
+    robot_pos = grid.find('@')
     
     if debug:
         print(f"Using input file: {filename}")
-        print(f"Original grid size: {len(original_grid)}x{len(original_grid[0])}")
-        print(f"Scaled grid size: {len(grid)}x{len(grid[0])}")
-        print(f"Robot starting position: {robot_pos}")
+        print(f"Original grid size: {original_grid.rows}x{original_grid.cols}")
+        print(f"Scaled grid size: {grid.rows}x{grid.cols}")
+        print(f"Robot starting position: {grid.position(robot_pos)}")
         print(f"Number of moves: {len(moves)}")
         print()
     
@@ -184,7 +167,7 @@ def main():
     gps_sum = calculate_wide_gps_sum(grid)
     
     if debug:
-        print(f"Final robot position: {final_robot_pos}")
+        print(f"Final robot position: {grid.position(final_robot_pos)}")
         print("Final state:")
         print_grid(grid)
     
@@ -1,54 +1,62 @@
 #!/usr/bin/env python3
 import heapq
+import os
 import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import counters
+from common.grid import Grid
+
 def parse_input(filename):
-    with open(filename, 'r') as f:
-        grid = [list(line.strip()) for line in f]
-    
-    start_pos = None
-    end_pos = None
+    grid = Grid.from_file(filename, pad=1, fill='#')
     
-    for row in range(len(grid)):
-        for col in range(len(grid[row])):
-            if grid[row][col] == 'S':
-                start_pos = (row, col)
-            elif grid[row][col] == 'E':
-                end_pos = (row, col)
+    start_pos = grid.find('S')
+    end_pos = grid.find('E')
     
     return grid, start_pos, end_pos
 
 def dijkstra(grid, start_pos, end_pos, debug=False):
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    # East, South, West, North as flat-index offsets
+    directions = [grid.right, grid.down, grid.left, grid.up]
     dir_names = ['East', 'South', 'West', 'North']
+    cells = grid.cells
+    wall = ord('#')
     
-    pq = [(0, start_pos[0], start_pos[1], 0)]
+    pq = [(0, start_pos, 0)]
     visited = set()
+    pushes = 1
+    pops = 0
     
     while pq:
-        cost, row, col, direction = heapq.heappop(pq)
+        cost, index, direction = heapq.heappop(pq)
+        pops += 1
         
         if debug:
-            print(f"Exploring: cost={cost}, pos=({row},{col}), dir={dir_names[direction]}")
+            print(f"Exploring: cost={cost}, pos={grid.position(index)}, dir={dir_names[direction]}")
         
-        if (row, col) == end_pos:
+        if index == end_pos:
+            counters.add('heap_pushes', pushes)
+            counters.add('heap_pops', pops)
             return cost
             
-        state = (row, col, direction)
+        state = index * 4 + direction
         if state in visited:
             continue
         visited.add(state)
         
-        dr, dc = directions[direction]
-        new_row, new_col = row + dr, col + dc
-        if (0 <= new_row < len(grid) and 0 <= new_col < len(grid[0]) and 
-            grid[new_row][new_col] != '#'):
-            heapq.heappush(pq, (cost + 1, new_row, new_col, direction))
+        # The maze is padded with walls, so no bounds check is needed
+        new_index = index + directions[direction]
+        if cells[new_index] != wall:
+            heapq.heappush(pq, (cost + 1, new_index, direction))
+            pushes += 1
         
-        heapq.heappush(pq, (cost + 1000, row, col, (direction + 1) % 4))
-        heapq.heappush(pq, (cost + 1000, row, col, (direction - 1) % 4))
+        heapq.heappush(pq, (cost + 1000, index, (direction + 1) % 4))
+        heapq.heappush(pq, (cost + 1000, index, (direction - 1) % 4))
+        pushes += 2
     
+    counters.add('heap_pushes', pushes)
+    counters.add('heap_pops', pops)
     return -1
 
 def main():
@@ -61,9 +69,9 @@ def main():
     grid, start_pos, end_pos = parse_input(filename)
     
     if args.debug or args.test:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        print(f"Start: {start_pos}")
-        print(f"End: {end_pos}")
+        print(f"Grid size: {grid.rows}x{grid.cols}")
+        print(f"Start: {grid.position(start_pos)}")
+        print(f"End: {grid.position(end_pos)}")
         print()
     
     result = dijkstra(grid, start_pos, end_pos, debug=args.debug)
@@ -1,81 +1,87 @@
 #!/usr/bin/env python3
 import heapq
+import os
 import sys
 import argparse
 from collections import defaultdict, deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import counters
+from common.grid import Grid
+
 def parse_input(filename):
-    with open(filename, 'r') as f:
-        grid = [list(line.strip()) for line in f]
-    
-    start_pos = None
-    end_pos = None
+    grid = Grid.from_file(filename, pad=1, fill='#')
     
-    for row in range(len(grid)):
-        for col in range(len(grid[row])):
-            if grid[row][col] == 'S':
-                start_pos = (row, col)
-            elif grid[row][col] == 'E':
-                end_pos = (row, col)
+    start_pos = grid.find('S')
+    end_pos = grid.find('E')
     
     return grid, start_pos, end_pos
 
 def dijkstra_all_paths(grid, start_pos, end_pos, debug=False):
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    # East, South, West, North as flat-index offsets
+    directions = [grid.right, grid.down, grid.left, grid.up]
     dir_names = ['East', 'South', 'West', 'North']
+    cells = grid.cells
+    wall = ord('#')
     
-    # Use distance dict and parent tracking
+    # Use distance dict and parent tracking, states are (index, direction)
     dist = defaultdict(lambda: float('inf'))
     parents = defaultdict(list)
     
-    start_state = (start_pos[0], start_pos[1], 0)  # Start facing East
+    start_state = (start_pos, 0)  # Start facing East
     dist[start_state] = 0
     
-    pq = [(0, start_pos[0], start_pos[1], 0)]
+    pq = [(0, start_pos, 0)]
+    pushes = 1
+    pops = 0
     
     while pq:
-        cost, row, col, direction = heapq.heappop(pq)
-        state = (row, col, direction)
+        cost, index, direction = heapq.heappop(pq)
+        pops += 1
+        state = (index, direction)
         
         # Skip if we've found a better path
         if cost > dist[state]:
             continue
             
         if debug:
-            print(f"Processing: cost={cost}, pos=({row},{col}), dir={dir_names[direction]}")
+            print(f"Processing: cost={cost}, pos={grid.position(index)}, dir={dir_names[direction]}")
         
-        # Try moving forward
-        dr, dc = directions[direction]
-        new_row, new_col = row + dr, col + dc
-        if (0 <= new_row < len(grid) and 0 <= new_col < len(grid[0]) and 
-            grid[new_row][new_col] != '#'):
-            new_state = (new_row, new_col, direction)
+        # Try moving forward; the maze is padded with walls, so no bounds check
+        new_index = index + directions[direction]
+        if cells[new_index] != wall:
+            new_state = (new_index, direction)
             new_cost = cost + 1
             
             if new_cost < dist[new_state]:
                 dist[new_state] = new_cost
                 parents[new_state] = [state]
-                heapq.heappush(pq, (new_cost, new_row, new_col, direction))
+                heapq.heappush(pq, (new_cost, new_index, direction))
+                pushes += 1
             elif new_cost == dist[new_state]:
                 parents[new_state].append(state)
         
         # Try rotating clockwise and counterclockwise
         for new_dir in [(direction + 1) % 4, (direction - 1) % 4]:
-            new_state = (row, col, new_dir)
+            new_state = (index, new_dir)
             new_cost = cost + 1000
             
             if new_cost < dist[new_state]:
                 dist[new_state] = new_cost
                 parents[new_state] = [state]
-                heapq.heappush(pq, (new_cost, row, col, new_dir))
+                heapq.heappush(pq, (new_cost, index, new_dir))
+                pushes += 1
             elif new_cost == dist[new_state]:
                 parents[new_state].append(state)
     
+    counters.add('heap_pushes', pushes)
+    counters.add('heap_pops', pops)
+    
     # Find minimum cost to reach end
     min_end_cost = float('inf')
     end_states = []
     for direction in range(4):
-        end_state = (end_pos[0], end_pos[1], direction)
+        end_state = (end_pos, direction)
         if dist[end_state] < min_end_cost:
             min_end_cost = dist[end_state]
             end_states = [end_state]
@@ -95,11 +101,11 @@ def find_optimal_tiles(end_states, parents, debug=False):
             continue
             
         visited.add(state)
-        row, col, direction = state
-        optimal_tiles.add((row, col))
+        index, direction = state
+        optimal_tiles.add(index)
         
         if debug:
-            print(f"Backtracking: pos=({row},{col}), dir={direction}")
+            print(f"Backtracking: index={index}, dir={direction}")
         
         for parent in parents[state]:
             if parent not in visited:
@@ -123,9 +129,9 @@ def main():
     grid, start_pos, end_pos = parse_input(filename)
     
     if args.debug or args.test:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        print(f"Start: {start_pos}")
-        print(f"End: {end_pos}")
+        print(f"Grid size: {grid.rows}x{grid.cols}")
+        print(f"Start: {grid.position(start_pos)}")
+        print(f"End: {grid.position(end_pos)}")
         print()
     
     min_cost, end_states, parents = dijkstra_all_paths(grid, start_pos, end_pos, debug=args.debug)
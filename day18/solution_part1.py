@@ -1,44 +1,53 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.grid import Grid
+from common.ints import read_int_columns
+
 def parse_input(filename):
     """Parse input file and return list of (x, y) coordinates."""
-    coordinates = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                x, y = map(int, line.split(','))
-                coordinates.append((x, y))
-    return coordinates
+    xs, ys = read_int_columns(filename, 2)
+    return list(zip(xs, ys))
+
+def build_grid(corrupted, grid_size):
+    """Memory grid with corrupted (x, y) positions marked as walls."""
+    grid = Grid.blank(grid_size, grid_size, '.', pad=1, fill='#')
+    for x, y in corrupted:
+        grid.set(y, x, '#')
+    return grid
 
 def bfs_shortest_path(corrupted, start, end, grid_size):
     """Find shortest path using BFS, avoiding corrupted positions."""
     if start in corrupted or end in corrupted:
         return -1
     
-    queue = deque([(start, 0)])  # (position, steps)
-    visited = {start}
+    grid = build_grid(corrupted, grid_size)
+    cells = grid.cells
+    start_index = grid.index(start[1], start[0])
+    end_index = grid.index(end[1], end[0])
+    
+    queue = deque([(start_index, 0)])  # (index, steps)
+    cells[start_index] = ord('O')  # Visited cells are marked in place
     
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # up, down, right, left
+    directions = grid.directions
     
     while queue:
-        (x, y), steps = queue.popleft()
+        index, steps = queue.popleft()
         
-        if (x, y) == end:
+        if index == end_index:
             return steps
         
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
+        for offset in directions:
+            new_index = index + offset
             
-            # Check bounds
-            if 0 <= nx < grid_size and 0 <= ny < grid_size:
-                # Check if not corrupted and not visited
-                if (nx, ny) not in corrupted and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), steps + 1))
+            # Padding, corrupted and visited cells are all non-'.'
+            if cells[new_index] == ord('.'):
+                cells[new_index] = ord('O')
+                queue.append((new_index, steps + 1))
     
     return -1  # No path found
 
@@ -1,88 +1,66 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.grid import Grid
+
 def parse_input(filename):
-    """Parse the racetrack input file and return grid, start and end positions."""
-    with open(filename, 'r') as f:
-        lines = [line.strip() for line in f.readlines()]
-    
-    grid = []
-    start_pos = None
-    end_pos = None
-    
-    for row, line in enumerate(lines):
-        grid_row = []
-        for col, char in enumerate(line):
-            if char == 'S':
-                start_pos = (row, col)
-                grid_row.append('.')  # Start is walkable
-            elif char == 'E':
-                end_pos = (row, col)
-                grid_row.append('.')  # End is walkable
-            else:
-                grid_row.append(char)
-        grid.append(grid_row)
+    """Parse the racetrack input file and return grid, start and end indices."""
+    grid = Grid.from_file(filename, pad=1, fill='#')
+    
+    start_pos = grid.find('S')
+    end_pos = grid.find('E')
+    grid.cells[start_pos] = ord('.')  # Start is walkable
+    grid.cells[end_pos] = ord('.')  # End is walkable
     
     return grid, start_pos, end_pos
 
 def find_normal_path(grid, start_pos, end_pos):
-    """Find the normal path without cheating using BFS. Return distance map."""
-    rows, cols = len(grid), len(grid[0])
+    """Find the normal path without cheating using BFS. Return distance map keyed by flat index."""
+    cells = grid.cells
     distances = {}
     queue = deque([(start_pos, 0)])
     distances[start_pos] = 0
     
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # right, left, down, up
+    directions = grid.directions
     
     while queue:
-        (row, col), dist = queue.popleft()
+        index, dist = queue.popleft()
         
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
+        for offset in directions:
+            new_index = index + offset
             
-            # Check bounds and walkable
-            if (0 <= new_row < rows and 0 <= new_col < cols and 
-                grid[new_row][new_col] == '.' and 
-                (new_row, new_col) not in distances):
-                
+            # The track is padded with walls, so no bounds check is needed
+            if cells[new_index] == ord('.') and new_index not in distances:
                 new_dist = dist + 1
-                distances[(new_row, new_col)] = new_dist
-                queue.append(((new_row, new_col), new_dist))
+                distances[new_index] = new_dist
+                queue.append((new_index, new_dist))
     
     return distances
 
 def find_cheats(grid, normal_path, threshold=100):
     """Find all cheats that save at least threshold picoseconds."""
-    rows, cols = len(grid), len(grid[0])
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    directions = grid.directions
     cheats = []
     
     # Try cheating from each position on the normal path
-    for (start_row, start_col), start_time in normal_path.items():
+    for start_index, start_time in normal_path.items():
         
-        # Try all possible 2-move cheat sequences
-        for dr1, dc1 in directions:
-            for dr2, dc2 in directions:
-                # First cheat move
-                mid_row = start_row + dr1
-                mid_col = start_col + dc1
-                
-                # Second cheat move
-                end_row = mid_row + dr2
-                end_col = mid_col + dc2
-                
-                # Check if end position is within bounds
-                if not (0 <= end_row < rows and 0 <= end_col < cols):
-                    continue
+        # Try all possible 2-move cheat sequences; path cells sit inside the
+        # outer wall, so two steps never leave the padded grid
+        for offset1 in directions:
+            for offset2 in directions:
+                end_index = start_index + offset1 + offset2
                 
                 # Check if end position is back on normal track
-                if (end_row, end_col) not in normal_path:
+                normal_time_to_end = normal_path.get(end_index)
+                if normal_time_to_end is None:
                     continue
                 
                 # Calculate time savings
-                normal_time_to_end = normal_path[(end_row, end_col)]
                 cheat_time = start_time + 2  # 2 picoseconds for the cheat
                 
                 # Only count if we actually save time
@@ -90,7 +68,7 @@ def find_cheats(grid, normal_path, threshold=100):
                     time_saved = normal_time_to_end - cheat_time
                     
                     if time_saved >= threshold:
-                        cheats.append(((start_row, start_col), (end_row, end_col), time_saved))
+                        cheats.append((start_index, end_index, time_saved))
     
     return cheats
 
@@ -109,8 +87,8 @@ def main():
     grid, start_pos, end_pos = parse_input(filename)
     
     if debug_mode:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        print(f"Start: {start_pos}, End: {end_pos}")
+        print(f"Grid size: {grid.rows}x{grid.cols}")
+        print(f"Start: {grid.position(start_pos)}, End: {grid.position(end_pos)}")
     
     # Find normal path
     normal_path = find_normal_path(grid, start_pos, end_pos)
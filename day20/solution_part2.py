@@ -1,84 +1,83 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.grid import Grid
+
 def parse_input(filename):
-    """Parse the racetrack input file and return grid, start and end positions."""
-    with open(filename, 'r') as f:
-        lines = [line.strip() for line in f.readlines()]
-    
-    grid = []
-    start_pos = None
-    end_pos = None
-    
-    for row, line in enumerate(lines):
-        grid_row = []
-        for col, char in enumerate(line):
-            if char == 'S':
-                start_pos = (row, col)
-                grid_row.append('.')  # Start is walkable
-            elif char == 'E':
-                end_pos = (row, col)
-                grid_row.append('.')  # End is walkable
-            else:
-                grid_row.append(char)
-        grid.append(grid_row)
+    """Parse the racetrack input file and return grid, start and end indices."""
+    grid = Grid.from_file(filename, pad=1, fill='#')
+    
+    start_pos = grid.find('S')
+    end_pos = grid.find('E')
+    grid.cells[start_pos] = ord('.')  # Start is walkable
+    grid.cells[end_pos] = ord('.')  # End is walkable
     
     return grid, start_pos, end_pos
 
 def find_normal_path(grid, start_pos, end_pos):
-    """Find the normal path without cheating using BFS. Return distance map."""
-    rows, cols = len(grid), len(grid[0])
+    """Find the normal path without cheating using BFS. Return distance map keyed by flat index."""
+    cells = grid.cells
     distances = {}
     queue = deque([(start_pos, 0)])
     distances[start_pos] = 0
     
-    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # right, left, down, up
+    directions = grid.directions
     
     while queue:
-        (row, col), dist = queue.popleft()
+        index, dist = queue.popleft()
         
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
+        for offset in directions:
+            new_index = index + offset
             
-            # Check bounds and walkable
-            if (0 <= new_row < rows and 0 <= new_col < cols and 
-                grid[new_row][new_col] == '.' and 
-                (new_row, new_col) not in distances):
-                
+            # The track is padded with walls, so no bounds check is needed
+            if cells[new_index] == ord('.') and new_index not in distances:
                 new_dist = dist + 1
-                distances[(new_row, new_col)] = new_dist
-                queue.append(((new_row, new_col), new_dist))
+                distances[new_index] = new_dist
+                queue.append((new_index, new_dist))
     
     return distances
 
+def cheat_offsets(grid, max_cheat_time):
+    """(col delta, flat offset, distance) for every cell within max_cheat_time moves.
+    
+    The col delta lets callers reject offsets that wrap into a neighbouring row.
+    """
+    offsets = []
+    for dr in range(-max_cheat_time, max_cheat_time + 1):
+        span = max_cheat_time - abs(dr)
+        for dc in range(-span, span + 1):
+            dist = abs(dr) + abs(dc)
+            if dist > 0:
+                offsets.append((dc, dr * grid.width + dc, dist))
+    return offsets
+
 def find_cheats_part2(grid, normal_path, max_cheat_time=20, threshold=100):
     """Find all cheats that save at least threshold picoseconds with up to max_cheat_time moves."""
-    rows, cols = len(grid), len(grid[0])
+    cols = grid.cols
     cheats = []
-    
-    # Convert normal_path positions to a list for easier iteration
-    path_positions = list(normal_path.keys())
+    offsets = cheat_offsets(grid, max_cheat_time)
     
     # Try cheating from each position on the normal path
-    for start_pos in path_positions:
-        start_row, start_col = start_pos
-        start_time = normal_path[start_pos]
+    for start_index, start_time in normal_path.items():
+        start_col = grid.position(start_index)[1]
         
-        # Check all positions within Manhattan distance of max_cheat_time
-        for end_pos in path_positions:
-            end_row, end_col = end_pos
-            
-            # Calculate Manhattan distance
-            manhattan_dist = abs(end_row - start_row) + abs(end_col - start_col)
+        # Only visit cells within Manhattan distance of max_cheat_time
+        for dc, offset, manhattan_dist in offsets:
+            # Rows outside the grid simply miss the path; columns must not
+            # wrap into the neighbouring row
+            if not 0 <= start_col + dc < cols:
+                continue
             
-            # Skip if cheat would take too long or is the same position
-            if manhattan_dist > max_cheat_time or manhattan_dist == 0:
+            end_index = start_index + offset
+            normal_time_to_end = normal_path.get(end_index)
+            if normal_time_to_end is None:
                 continue
             
             # Calculate time savings
-            normal_time_to_end = normal_path[end_pos]
             cheat_time = start_time + manhattan_dist
             
             # Only count if we actually save time
@@ -86,7 +85,7 @@ def find_cheats_part2(grid, normal_path, max_cheat_time=20, threshold=100):
                 time_saved = normal_time_to_end - cheat_time
                 
                 if time_saved >= threshold:
-                    cheats.append((start_pos, end_pos, time_saved))
+                    cheats.append((start_index, end_index, time_saved))
     
     return cheats
 
@@ -105,8 +104,8 @@ def main():
     grid, start_pos, end_pos = parse_input(filename)
     
     if debug_mode:
-        print(f"Grid size: {len(grid)}x{len(grid[0])}")
-        print(f"Start: {start_pos}, End: {end_pos}")
+        print(f"Grid size: {grid.rows}x{grid.cols}")
+        print(f"Start: {grid.position(start_pos)}, End: {grid.position(end_pos)}")
     
     # Find normal path
     normal_path = find_normal_path(grid, start_pos, end_pos)
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 from functools import lru_cache
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import counters
+
 # Keypad layouts
 NUMERIC_KEYPAD = {
     '7': (0, 0), '8': (0, 1), '9': (0, 2),
@@ -125,6 +129,7 @@ def get_move_cost(from_btn, to_btn, depth, is_numeric=False):
 
 def calculate_sequence_cost(code, layers):
     """Calculate the minimum cost to input a code through given layers."""
+    before = get_move_cost.cache_info()
     total_cost = 0
     current_btn = 'A'  # Start at A
     
@@ -134,6 +139,9 @@ def calculate_sequence_cost(code, layers):
         total_cost += cost
         current_btn = target_btn
     
+    after = get_move_cost.cache_info()
+    counters.add('cache_hits', after.hits - before.hits)
+    counters.add('cache_misses', after.misses - before.misses)
     return total_cost
 
 def calculate_complexity(code, layers):
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
+import os
 import sys
 import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.ints import read_ints
+
 def parse_input(filename):
     """Parse input file to get initial secret numbers."""
-    with open(filename, 'r') as f:
-        return [int(line.strip()) for line in f if line.strip()]
+    return read_ints(filename)
 
 def mix(value, secret):
     """Mix a value into the secret number using XOR."""
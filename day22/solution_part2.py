@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
+import os
 import sys
 import argparse
 from collections import defaultdict
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.ints import read_ints
+
 def parse_input(filename):
     """Parse input file to get initial secret numbers."""
-    with open(filename, 'r') as f:
-        return [int(line.strip()) for line in f if line.strip()]
+    return read_ints(filename)
 
 def mix(value, secret):
     """Mix a value into the secret number using XOR."""
@@ -66,13 +69,8 @@ def find_pattern_sales(prices, changes):
     
     return pattern_sales
 
-def solve(filename, debug=False):
-    """Main solution function for Part 2."""
-    initial_secrets = parse_input(filename)
-    
-    if debug:
-        print(f"Initial secrets: {initial_secrets}")
-    
+def find_best_pattern(initial_secrets, debug=False):
+    """Find the 4-change pattern that sells for the most bananas across all buyers."""
     # Track total bananas for each possible pattern
     pattern_totals = defaultdict(int)
     
@@ -101,7 +99,16 @@ def solve(filename, debug=False):
         print(f"Best pattern: {best_pattern[0]} -> {best_pattern[1]} bananas")
         print(f"Total unique patterns found: {len(pattern_totals)}")
     
-    return best_pattern[1]
+    return best_pattern
+
+def solve(filename, debug=False):
+    """Main solution function for Part 2."""
+    initial_secrets = parse_input(filename)
+    
+    if debug:
+        print(f"Initial secrets: {initial_secrets}")
+    
+    return find_best_pattern(initial_secrets, debug)[1]
 
 def main():
     parser = argparse.ArgumentParser(description='Day 22: Monkey Market - Part 2')
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
+import os
 import sys
 import argparse
 from collections import defaultdict
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import counters
+
 def parse_input(filename):
     """Parse input file to build adjacency graph."""
     graph = defaultdict(set)
@@ -22,6 +26,10 @@ def parse_input(filename):
     
     return graph
 
+# Nodes visited by the current find_largest_clique search; reported to counters
+# once at the end so the recursion itself only bumps an int
+bron_kerbosch_nodes = [0]
+
 def bron_kerbosch(graph, r, p, x, cliques):
     """
     Bron-Kerbosch algorithm to find all maximal cliques.
@@ -33,6 +41,8 @@ def bron_kerbosch(graph, r, p, x, cliques):
         x: excluded set (nodes already processed)
         cliques: list to store found cliques
     """
+    bron_kerbosch_nodes[0] += 1
+    
     if not p and not x:
         # Found a maximal clique
         cliques.append(r.copy())
@@ -65,7 +75,9 @@ def find_largest_clique(graph):
     
     # Initialize: R=empty, P=all vertices, X=empty
     all_vertices = set(graph.keys())
+    bron_kerbosch_nodes[0] = 0
     bron_kerbosch(graph, set(), all_vertices, set(), cliques)
+    counters.add('bron_kerbosch_nodes', bron_kerbosch_nodes[0])
     
     # Find the largest clique
     if not cliques:
@@ -50,13 +50,8 @@ def is_compatible(lock_heights, key_heights):
             return False
     return True
 
-def solve(filename, debug=False):
-    """Main solution function."""
-    schematics = parse_input(filename)
-    
-    if debug:
-        print(f"Parsed {len(schematics)} schematics")
-    
+def count_compatible_pairs(schematics, debug=False):
+    """Count lock/key pairs that fit together without overlapping."""
     locks = []
     keys = []
     
@@ -91,6 +86,15 @@ def solve(filename, debug=False):
     
     return compatible_pairs
 
+def solve(filename, debug=False):
+    """Main solution function."""
+    schematics = parse_input(filename)
+    
+    if debug:
+        print(f"Parsed {len(schematics)} schematics")
+    
+    return count_compatible_pairs(schematics, debug)
+
 def main():
     parser = argparse.ArgumentParser(description='Day 25: Code Chronicle - Part 1')
     parser.add_argument('--test', action='store_true', help='Run with example.txt')
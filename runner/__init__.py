@@ -0,0 +1,3 @@
+"""Single-process runner for the Advent of Code 2024 solutions."""
+from runner.core import run_solver
+from runner.registry import SOLVERS, get_solver, select_solvers
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Run any subset of the day/part solvers in one interpreter.
+
+    python3 -m runner                 # every day, both parts
+    python3 -m runner 6 16 20 --part 2
+    python3 -m runner 1-5 --test      # example inputs
+    python3 -m runner --jobs 8        # spread over 8 worker processes
+    python3 -m runner 16 --profile    # cProfile output in profiles/
+    python3 -m runner 16 --stats      # work counters as JSON
+    python3 -m runner 11 --part 2 --param blinks=100 --no-cache
+"""
+import argparse
+import time
+
+from runner.cache import ResultCache
+from runner.core import (counters_json, format_duration, format_table, parse_days, parse_params,
+                         run_solver)
+from runner.parallel import run_parallel, save_timings
+from runner.profiling import PROFILE_DIR
+from runner.registry import select_solvers
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Advent of Code 2024: run solvers in a single process')
+    parser.add_argument('days', nargs='*', help='Days to run, e.g. 6 or 1-5 (default: all)')
+    parser.add_argument('--part', type=int, choices=[1, 2], action='append', help='Only run this part')
+    parser.add_argument('--test', action='store_true', help='Run with each day\'s example file instead of input.txt')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes; slowest solvers from the previous run are started first')
+    parser.add_argument('--profile', nargs='?', const=PROFILE_DIR, metavar='DIR',
+                        help='Profile each solve step with cProfile and write dayNN_partN.pstats '
+                             'and .collapsed files to DIR (default: profiles/)')
+    parser.add_argument('--stats', nargs='?', const='-', metavar='FILE',
+                        help='Dump work counters (heap pushes, cache hits, ...) as JSON to FILE '
+                             '(default: stdout)')
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUE',
+                        help='Override a solver parameter, e.g. blinks=100 or max_cheat_time=10')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not update the on-disk answer cache')
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+
+    solvers = select_solvers(parse_days(args.days), args.part)
+    params = parse_params(args.param)
+    cache = None if args.no_cache else ResultCache()
+    start = time.perf_counter()
+    if args.jobs > 1:
+        results = run_parallel(solvers, args.jobs, test=args.test, profile=args.profile,
+                               cache=cache, params=params)
+    else:
+        results = [run_solver(solver, test=args.test, params=params, profile=args.profile, cache=cache)
+                   for solver in solvers]
+    elapsed = time.perf_counter() - start
+
+    if cache:
+        cache.prune()
+
+    print(format_table(results))
+    print(f"Elapsed: {format_duration(elapsed)}")
+
+    if args.profile:
+        print(f"Profiles written to {args.profile}")
+
+    if args.stats == '-':
+        print(counters_json(results))
+    elif args.stats:
+        with open(args.stats, 'w') as f:
+            f.write(counters_json(results) + '\n')
+
+    # Profiled timings carry the profiler's overhead, keep them out of the schedule
+    if not args.test and not args.profile:
+        save_timings(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Solve many input files for one day in a single process, streaming JSON lines.
+
+    python3 -m runner.batch 21 submissions/day21/
+    python3 -m runner.batch 14 'submissions/day14/*.txt' --part 1
+    python3 -m runner.batch 18 inputs/ --test     # example-sized params
+
+Each solver module is loaded once, so process-wide caches such as day 21's
+get_move_cost lru_cache stay warm from one input to the next.  A line is
+written (and flushed) as soon as each input/part finishes; an input that
+makes a solver raise yields an "error" line instead of stopping the batch.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+from runner.cache import ResultCache
+from runner.core import parse_params, run_solver
+from runner.registry import select_solvers
+
+
+def expand_inputs(patterns):
+    """Files named by directories (every *.txt inside), globs or plain paths, in order."""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.extend(sorted(glob.glob(os.path.join(pattern, '*.txt'))))
+        elif glob.has_magic(pattern):
+            files.extend(sorted(glob.glob(pattern)))
+        else:
+            files.append(pattern)
+    return files
+
+
+def run_batch(solvers, files, test=False, params=None, cache=None, out=sys.stdout):
+    """Run every solver on every file, writing one JSON object per line to `out`."""
+    for filename in files:
+        for solver in solvers:
+            try:
+                result = run_solver(solver, filename=filename, test=test, params=params, cache=cache)
+                line = {
+                    'day': solver.day,
+                    'part': solver.part,
+                    'input': filename,
+                    'answer': result['answer'],
+                    'parse_time': result['parse_time'],
+                    'solve_time': result['solve_time'],
+                    'cached': result['cached'],
+                    'counters': result['counters'],
+                }
+            except Exception as e:
+                line = {
+                    'day': solver.day,
+                    'part': solver.part,
+                    'input': filename,
+                    'error': f"{type(e).__name__}: {e}",
+                }
+            out.write(json.dumps(line) + '\n')
+            out.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Advent of Code 2024: solve many inputs for one day')
+    parser.add_argument('day', type=int, help='Day whose solvers to run')
+    parser.add_argument('inputs', nargs='+', help='Input files, directories of *.txt files, or globs')
+    parser.add_argument('--part', type=int, choices=[1, 2], action='append', help='Only run this part')
+    parser.add_argument('--test', action='store_true', help='Use the example parameters (grid sizes etc.)')
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUE',
+                        help='Override a solver parameter, e.g. blinks=100')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not update the on-disk answer cache')
+    args = parser.parse_args()
+
+    solvers = select_solvers({args.day}, args.part)
+    files = expand_inputs(args.inputs)
+    if not files:
+        parser.error('no input files matched')
+
+    cache = None if args.no_cache else ResultCache()
+    run_batch(solvers, files, test=args.test, params=parse_params(args.param), cache=cache)
+    if cache:
+        cache.prune()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Repeat solvers on input.txt, report min/median/p95 and gate on a stored baseline.
+
+    python3 -m runner.benchmark --save benchmark_baseline.json
+    python3 -m runner.benchmark 6 20 --compare benchmark_baseline.json --tolerance 15
+    python3 -m runner.benchmark 5 19 20 --scaling 1,10,100
+    python3 -m runner.benchmark 3 --scaling 1,10,100 --variant engine=regex,tokenizer
+
+With --compare the exit status is 1 when any solver's median solve time is
+more than --tolerance percent slower than the baseline.  --scaling runs each
+solver on synthetic inputs of the given size multipliers instead and fits
+time ~ size^k, reporting the empirical exponent k.  --variant runs every
+solver once per value of a parameter so alternative engines can be compared
+side by side.
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+
+from runner.core import format_duration, parse_days, parse_params, run_solver
+from runner.generators import generate_input
+from runner.registry import select_solvers
+
+# Days whose solvers take long enough to be noisy; they get extra repetitions
+HEAVY_DAYS = {6, 9, 16, 19, 20, 22, 23}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(times):
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'p95': percentile(times, 95),
+        'runs': len(times),
+    }
+
+
+def parse_variants(value):
+    """'engine=regex,tokenizer' -> [(' [engine=regex]', {'engine': 'regex'}), ...]; no value -> one plain run."""
+    if not value:
+        return [('', {})]
+    name, _, choices = value.partition('=')
+    return [(f"[{name}={choice}]", parse_params([f"{name}={choice}"])) for choice in choices.split(',')]
+
+
+def benchmark_solver(solver, repeat, params=None):
+    """Run a solver `repeat` times; the input is re-parsed every run since some solvers mutate it."""
+    parse_times = []
+    solve_times = []
+    answer = None
+    for _ in range(repeat):
+        result = run_solver(solver, params=params)
+        parse_times.append(result['parse_time'])
+        solve_times.append(result['solve_time'])
+        answer = result['answer']
+
+    return {
+        'answer': answer,
+        'parse': summarize(parse_times),
+        'solve': summarize(solve_times),
+    }
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Return (key, current, previous, slowdown%) for each solver slower than the tolerance."""
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        previous = baseline[key]['solve']['median']
+        current = result['solve']['median']
+        slowdown = (current - previous) / previous * 100 if previous else 0.0
+        if slowdown > tolerance:
+            regressions.append((key, current, previous, slowdown))
+    return regressions
+
+
+def fit_exponent(points):
+    """Least-squares slope of log(time) against log(size) for (size, time) points."""
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(max(seconds, 1e-9)) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def measure_scaling(solver, scales, repeat, workdir, overrides=None):
+    """Best-of-`repeat` solve time on a generated input at each scale; returns (points, exponent)."""
+    points = []
+    for scale in scales:
+        path = os.path.join(workdir, f"day{solver.day:02d}_x{scale}.txt")
+        text, params = generate_input(solver.day, scale)
+        with open(path, 'w') as f:
+            f.write(text)
+        params.update(overrides or {})
+        best = min(run_solver(solver, filename=path, params=params)['solve_time']
+                   for _ in range(repeat))
+        points.append((len(text), best))
+    return points, fit_exponent(points)
+
+
+def run_scaling(solvers, scales, repeat, variants=(('', {}),)):
+    width = max(14, *(14 + len(label) for label, _ in variants))
+    print(f"{'Solver':<{width}} " + ' '.join(f"{f'{scale}x':>9}" for scale in scales) + f" {'Exponent':>9}")
+    with tempfile.TemporaryDirectory(prefix='aoc-scaling-') as workdir:
+        for solver in solvers:
+            for label, overrides in variants:
+                points, exponent = measure_scaling(solver, scales, repeat, workdir, overrides)
+                timings = ' '.join(f"{format_duration(seconds):>9}" for _, seconds in points)
+                print(f"{solver.key + label:<{width}} {timings} {exponent:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark solvers against a stored baseline')
+    parser.add_argument('days', nargs='*', help='Days to benchmark, e.g. 6 or 1-5 (default: all)')
+    parser.add_argument('--part', type=int, choices=[1, 2], action='append', help='Only benchmark this part')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions per solver (default: 3)')
+    parser.add_argument('--heavy-repeat', type=int, default=7,
+                        help=f"Repetitions for the heavy days {sorted(HEAVY_DAYS)} (default: 7)")
+    parser.add_argument('--save', metavar='FILE', help='Write results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', help='Compare against a JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=10.0,
+                        help='Allowed median slowdown in percent before failing (default: 10)')
+    parser.add_argument('--scaling', metavar='SCALES',
+                        help='Comma-separated input size multipliers, e.g. 1,10,100; fits a complexity exponent')
+    parser.add_argument('--variant', metavar='NAME=V1,V2',
+                        help='Run each solver once per parameter value, e.g. engine=regex,tokenizer')
+    args = parser.parse_args()
+
+    variants = parse_variants(args.variant)
+    if args.scaling:
+        scales = [int(scale) for scale in args.scaling.split(',')]
+        run_scaling(select_solvers(parse_days(args.days), args.part), scales, args.repeat, variants)
+        return
+
+    results = {}
+    width = max(14, *(14 + len(label) for label, _ in variants))
+    print(f"{'Solver':<{width}} {'Runs':>4} {'Min':>9} {'Median':>9} {'P95':>9}")
+    for solver in select_solvers(parse_days(args.days), args.part):
+        repeat = args.heavy_repeat if solver.day in HEAVY_DAYS else args.repeat
+        for label, overrides in variants:
+            result = benchmark_solver(solver, repeat, overrides)
+            results[solver.key + label] = result
+            solve = result['solve']
+            print(f"{solver.key + label:<{width}} {solve['runs']:>4} {format_duration(solve['min']):>9} "
+                  f"{format_duration(solve['median']):>9} {format_duration(solve['p95']):>9}")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} solver(s) regressed by more than {args.tolerance:g}%:")
+            for key, current, previous, slowdown in regressions:
+                print(f"  {key}: {format_duration(previous)} -> {format_duration(current)} (+{slowdown:.1f}%)")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:g}% against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""On-disk answer cache keyed by what an answer actually depends on.
+
+The key is the SHA-256 of the input file bytes, the solver's source (every
+.py file in its day directory plus the shared common/ helpers and the
+registry's parse/solve functions) and its parameters.  Editing a solution,
+its input or a parameter therefore always misses; re-running unchanged
+solvers returns the stored answer without parsing or solving.
+
+Entries are small JSON files.  prune() drops entries older than `max_age`
+and then the least recently used ones until the directory fits `max_bytes`,
+so sweeping a parameter such as day 11's blink count cannot grow it without
+bound.
+"""
+import glob
+import hashlib
+import inspect
+import json
+import os
+import time
+
+from runner.loader import ROOT, day_dir
+
+CACHE_DIR = os.path.join(ROOT, '.runner_cache')
+MAX_BYTES = 16 * 1024 * 1024
+MAX_AGE = 30 * 24 * 3600
+
+
+def source_files(solver):
+    return sorted(glob.glob(os.path.join(day_dir(solver.day), '*.py')) +
+                  glob.glob(os.path.join(ROOT, 'common', '*.py')))
+
+
+def cache_key(solver, filename, params):
+    digest = hashlib.sha256()
+    digest.update(solver.key.encode())
+    with open(filename, 'rb') as f:
+        digest.update(hashlib.sha256(f.read()).digest())
+    for path in source_files(solver):
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    for func in (solver.parse, solver.solve):
+        digest.update(inspect.getsource(func).encode())
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_BYTES, max_age=MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """Stored entry for `key`, or None.  A hit refreshes the entry's age."""
+        path = self.path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key, entry):
+        os.makedirs(self.directory, exist_ok=True)
+        # Write then rename so parallel workers never read a half-written entry
+        temp_path = self.path(key) + f".{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(temp_path, self.path(key))
+
+    def prune(self):
+        """Evict expired entries, then least recently used ones over the size budget."""
+        now = time.time()
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                os.remove(path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
@@ -0,0 +1,146 @@
+"""Run registered solvers in-process and time their parse and solve steps."""
+import contextlib
+import cProfile
+import io
+import json
+import os
+import time
+
+from common import counters
+from runner.cache import cache_key
+from runner.loader import day_dir
+from runner.profiling import write_profile
+
+
+def parse_days(values):
+    """Expand day arguments such as `6`, `1-5` into a set of day numbers."""
+    days = set()
+    for value in values:
+        if '-' in value:
+            first, last = value.split('-')
+            days.update(range(int(first), int(last) + 1))
+        else:
+            days.add(int(value))
+    return days
+
+
+def parse_params(values):
+    """Turn NAME=VALUE arguments into a params dict, converting integers."""
+    params = {}
+    for value in values:
+        name, _, raw = value.partition('=')
+        try:
+            params[name] = int(raw)
+        except ValueError:
+            params[name] = raw
+    return params
+
+
+def input_path(solver, test=False):
+    """Default input file for a solver: input.txt, or its example file in test mode."""
+    return os.path.join(day_dir(solver.day), solver.example if test else 'input.txt')
+
+
+def run_solver(solver, filename=None, test=False, params=None, profile=None, cache=None):
+    """Parse and solve one day/part, returning the answer and timings in seconds.
+
+    Solvers print progress in places (day 17's backtracking search), so their
+    stdout is swallowed to keep the runner's own output readable.  When
+    `profile` names a directory the solve step runs under cProfile and its
+    output is written there (timings then include the profiler overhead).
+    Work counters bumped by the solve step are returned under 'counters'.
+
+    With a ResultCache in `cache` an unchanged solver/input/params combination
+    returns its stored answer (and counters) with 'cached' set, skipping both
+    steps.  Profiled runs always execute.
+    """
+    filename = filename or input_path(solver, test)
+    params = solver.get_params(test, params)
+
+    wall_start = time.perf_counter()
+    key = cache_key(solver, filename, params) if cache and not profile else None
+    entry = cache.get(key) if key else None
+    if entry is not None:
+        return {
+            'day': solver.day,
+            'part': solver.part,
+            'entry': solver.entry,
+            'input': filename,
+            'answer': entry['answer'],
+            'parse_time': 0.0,
+            'solve_time': 0.0,
+            'wall_time': time.perf_counter() - wall_start,
+            'counters': entry['counters'],
+            'cached': True,
+        }
+
+    module = solver.module()
+    with contextlib.redirect_stdout(io.StringIO()):
+        parse_start = time.perf_counter()
+        data = solver.parse(module, filename, params)
+        profiler = cProfile.Profile() if profile else None
+        counters.reset()
+        solve_start = time.perf_counter()
+        if profiler:
+            answer = profiler.runcall(solver.solve, module, data, params)
+        else:
+            answer = solver.solve(module, data, params)
+        solve_end = time.perf_counter()
+
+    if profiler:
+        write_profile(profiler, solver, profile)
+
+    result = {
+        'day': solver.day,
+        'part': solver.part,
+        'entry': solver.entry,
+        'input': filename,
+        'answer': answer,
+        'parse_time': solve_start - parse_start,
+        'solve_time': solve_end - solve_start,
+        'wall_time': solve_end - wall_start,
+        'counters': counters.snapshot(),
+        'cached': False,
+    }
+    if key:
+        cache.put(key, {'solver': solver.key, 'input': filename, 'params': params,
+                        'answer': answer, 'counters': result['counters'],
+                        'solve_time': result['solve_time'], 'created': time.time()})
+    return result
+
+
+def counters_json(results):
+    """Work counters of each run keyed by day/part, as a JSON document."""
+    return json.dumps({f"day{result['day']:02d}/part{result['part']}": result['counters']
+                       for result in results}, indent=2)
+
+
+def format_duration(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_table(results):
+    """Render run results as a fixed-width timing table."""
+    header = f"{'Day':>3} {'Part':>4}  {'Answer':<40} {'Parse':>9} {'Solve':>9} {'Wall':>9}"
+    lines = [header, '-' * len(header)]
+    for result in results:
+        answer = str(result['answer'])
+        if len(answer) > 40:
+            answer = answer[:37] + '...'
+        if result.get('cached'):
+            parse, solve = 'cached', 'cached'
+        else:
+            parse, solve = format_duration(result['parse_time']), format_duration(result['solve_time'])
+        lines.append(f"{result['day']:>3} {result['part']:>4}  {answer:<40} "
+                     f"{parse:>9} {solve:>9} "
+                     f"{format_duration(result['wall_time']):>9}")
+    lines.append('-' * len(header))
+    lines.append(f"{'Total':<50} "
+                 f"{format_duration(sum(r['parse_time'] for r in results)):>9} "
+                 f"{format_duration(sum(r['solve_time'] for r in results)):>9} "
+                 f"{format_duration(sum(r['wall_time'] for r in results)):>9}")
+    return '\n'.join(lines)
@@ -0,0 +1,437 @@
+"""Synthetic puzzle-input generators for measuring how solvers scale.
+
+`generate_input(day, scale)` returns the text of a valid input roughly
+`scale` times the size of the real one, plus any solver parameter overrides
+the bigger input needs (grid sizes, byte counts).  Grid days grow both sides
+by sqrt(scale) so the cell count, not the side length, scales linearly.
+Days 5 and 19 likewise grow both the length of each update/design and the
+number of them by sqrt(scale), so the fitted exponent also reflects the
+per-item cost: a solver linear in the item length fits ~1, a quadratic one
+~1.5.
+"""
+import math
+import random
+import string
+from collections import deque
+
+
+def scaled_side(base, scale, odd=False):
+    side = max(5, round(base * math.sqrt(scale)))
+    if odd and side % 2 == 0:
+        side += 1
+    return side
+
+
+def grid_text(grid):
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+def carve_maze(rng, size):
+    """Perfect maze on an odd-sized grid via iterative randomized DFS."""
+    grid = [['#'] * size for _ in range(size)]
+    stack = [(size - 2, 1)]
+    grid[size - 2][1] = '.'
+    while stack:
+        r, c = stack[-1]
+        neighbors = [(r + dr, c + dc, dr // 2, dc // 2)
+                     for dr, dc in ((0, 2), (0, -2), (2, 0), (-2, 0))
+                     if 0 < r + dr < size - 1 and 0 < c + dc < size - 1
+                     and grid[r + dr][c + dc] == '#']
+        if not neighbors:
+            stack.pop()
+            continue
+        nr, nc, hr, hc = rng.choice(neighbors)
+        grid[r + hr][c + hc] = '.'
+        grid[nr][nc] = '.'
+        stack.append((nr, nc))
+    return grid
+
+
+def gen_day01(rng, scale):
+    lines = []
+    left_values = []
+    for _ in range(1000 * scale):
+        left = rng.randint(10000, 99999)
+        left_values.append(left)
+        right = rng.choice(left_values) if rng.random() < 0.3 else rng.randint(10000, 99999)
+        lines.append(f"{left}   {right}")
+    return '\n'.join(lines) + '\n', {}
+
+
+def gen_day02(rng, scale):
+    lines = []
+    for _ in range(1000 * scale):
+        direction = rng.choice((1, -1))
+        levels = [rng.randint(20, 70)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        if rng.random() < 0.6:
+            levels[rng.randrange(len(levels))] += rng.randint(-4, 4)
+        lines.append(' '.join(map(str, levels)))
+    return '\n'.join(lines) + '\n', {}
+
+
+def gen_day03(rng, scale):
+    noise = "mul()don't,0123456789 ?[]{}<>!@#$%^&*+-_'"
+    lines = []
+    for _ in range(6 * scale):
+        pieces = []
+        length = 0
+        while length < 3000:
+            roll = rng.random()
+            if roll < 0.12:
+                piece = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+            elif roll < 0.14:
+                piece = "do()"
+            elif roll < 0.16:
+                piece = "don't()"
+            else:
+                piece = ''.join(rng.choice(noise) for _ in range(rng.randint(1, 6)))
+            pieces.append(piece)
+            length += len(piece)
+        lines.append(''.join(pieces))
+    return '\n'.join(lines) + '\n', {}
+
+
+def gen_day04(rng, scale):
+    side = scaled_side(140, scale)
+    return grid_text([[rng.choice('XMAS') for _ in range(side)] for _ in range(side)]), {}
+
+
+def gen_day05(rng, scale):
+    # Every pair of pages has a rule, so the rules grow with the square of the page count
+    growth = math.sqrt(scale)
+    page_count = round(49 * growth)
+    pages = rng.sample(range(10, 10 + 2 * page_count + 90), page_count)
+    rules = [(pages[i], pages[j]) for i in range(len(pages)) for j in range(i + 1, len(pages))]
+    rng.shuffle(rules)
+    lines = [f"{a}|{b}" for a, b in rules]
+    lines.append('')
+    rank = {page: i for i, page in enumerate(pages)}
+    for _ in range(round(200 * growth)):
+        length = round(rng.randrange(5, 24) * growth) | 1
+        update = rng.sample(pages, min(length, page_count))
+        if rng.random() < 0.5:
+            update.sort(key=rank.get)
+        lines.append(','.join(map(str, update)))
+    return '\n'.join(lines) + '\n', {}
+
+
+def guard_loop_obstacle(grid, start):
+    """Walk the day 6 guard; the obstacle it turns at once it starts looping, or None if it leaves."""
+    rows, cols = len(grid), len(grid[0])
+    r, c = start
+    direction = 0
+    turns = set()
+    while True:
+        dr, dc = ((-1, 0), (0, 1), (1, 0), (0, -1))[direction]
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < rows and 0 <= nc < cols):
+            return None
+        if grid[nr][nc] == '#':
+            if (r, c, direction) in turns:
+                return nr, nc
+            turns.add((r, c, direction))
+            direction = (direction + 1) % 4
+        else:
+            r, c = nr, nc
+
+
+def gen_day06(rng, scale):
+    side = scaled_side(130, scale)
+    grid = [['#' if rng.random() < 0.05 else '.' for _ in range(side)] for _ in range(side)]
+    start = (side // 2, side // 2)
+    grid[start[0]][start[1]] = '.'
+    # The solvers assume the guard walks off the map; break loops until it does
+    obstacle = guard_loop_obstacle(grid, start)
+    while obstacle:
+        grid[obstacle[0]][obstacle[1]] = '.'
+        obstacle = guard_loop_obstacle(grid, start)
+    grid[start[0]][start[1]] = '^'
+    return grid_text(grid), {}
+
+
+def gen_day07(rng, scale):
+    lines = []
+    for _ in range(850 * scale):
+        numbers = [rng.randint(1, 99) for _ in range(rng.randint(3, 12))]
+        value = numbers[0]
+        for number in numbers[1:]:
+            op = rng.choice('+*|')
+            if op == '+':
+                value += number
+            elif op == '*':
+                value *= number
+            else:
+                value = int(f"{value}{number}")
+        if rng.random() < 0.5:
+            value += 1
+        lines.append(f"{value}: {' '.join(map(str, numbers))}")
+    return '\n'.join(lines) + '\n', {}
+
+
+def gen_day08(rng, scale):
+    side = scaled_side(50, scale)
+    frequencies = string.ascii_letters + string.digits
+    grid = [[rng.choice(frequencies) if rng.random() < 0.08 else '.' for _ in range(side)]
+            for _ in range(side)]
+    return grid_text(grid), {}
+
+
+def gen_day09(rng, scale):
+    digits = []
+    for i in range(20000 * scale - 1):
+        digits.append(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)))
+    return ''.join(digits) + '\n', {}
+
+
+def gen_day10(rng, scale):
+    side = scaled_side(58, scale)
+    grid = [[str((r + c + rng.choice((0, 0, 0, 1, -1))) % 10) for c in range(side)]
+            for r in range(side)]
+    return grid_text(grid), {}
+
+
+def gen_day11(rng, scale):
+    return ' '.join(str(rng.randint(0, 10 ** 6)) for _ in range(8 * scale)) + '\n', {}
+
+
+def gen_day12(rng, scale):
+    side = scaled_side(140, scale)
+    blocks = {}
+    grid = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            block = (r // 6, c // 6)
+            if block not in blocks:
+                blocks[block] = rng.choice(string.ascii_uppercase)
+            row.append(rng.choice(string.ascii_uppercase) if rng.random() < 0.1 else blocks[block])
+        grid.append(row)
+    return grid_text(grid), {}
+
+
+def gen_day13(rng, scale):
+    machines = []
+    for _ in range(320 * scale):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}")
+    return '\n\n'.join(machines) + '\n', {}
+
+
+def gen_day14(rng, scale):
+    lines = []
+    for _ in range(500 * scale):
+        lines.append(f"p={rng.randrange(101)},{rng.randrange(103)} "
+                     f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}")
+    return '\n'.join(lines) + '\n', {}
+
+
+def gen_day15(rng, scale):
+    side = scaled_side(50, scale)
+    grid = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            if r in (0, side - 1) or c in (0, side - 1):
+                row.append('#')
+            else:
+                roll = rng.random()
+                row.append('#' if roll < 0.05 else 'O' if roll < 0.3 else '.')
+        grid.append(row)
+    grid[side // 2][side // 2] = '@'
+    moves = ''.join(rng.choice('<>^v') for _ in range(20000 * scale))
+    move_lines = [moves[i:i + 1000] for i in range(0, len(moves), 1000)]
+    return grid_text(grid) + '\n' + '\n'.join(move_lines) + '\n', {}
+
+
+def gen_day16(rng, scale):
+    side = scaled_side(141, scale, odd=True)
+    grid = carve_maze(rng, side)
+    # Knock out extra walls so there are several optimal routes
+    for r in range(1, side - 1):
+        for c in range(1, side - 1):
+            if grid[r][c] == '#' and (r + c) % 2 == 1 and rng.random() < 0.05:
+                grid[r][c] = '.'
+    grid[side - 2][1] = 'S'
+    grid[1][side - 2] = 'E'
+    return grid_text(grid), {}
+
+
+def gen_day17(rng, scale):
+    a = rng.getrandbits(27 * scale) | (1 << (27 * scale - 1))
+    text = (f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\n"
+            "Program: 2,4,1,2,7,5,4,1,1,3,5,5,0,3,3,0\n")
+    return text, {}
+
+
+def gen_day18(rng, scale):
+    size = scaled_side(71, scale)
+    cells = [(x, y) for x in range(size) for y in range(size)
+             if (x, y) not in ((0, 0), (size - 1, size - 1))]
+    rng.shuffle(cells)
+    coordinates = cells[:int(len(cells) * 0.7)]
+    text = '\n'.join(f"{x},{y}" for x, y in coordinates) + '\n'
+    return text, {'grid_size': size, 'num_bytes': int(size * size * 0.2)}
+
+
+def gen_day19(rng, scale):
+    patterns = set()
+    while len(patterns) < 450:
+        pattern = ''.join(rng.choice('wubrg') for _ in range(rng.randint(1, 8)))
+        # Without 'b' or 'bb' in any pattern, a design ending in 'bb' is impossible
+        if pattern != 'b' and 'bb' not in pattern:
+            patterns.add(pattern)
+    patterns = sorted(patterns)
+    growth = math.sqrt(scale)
+    designs = []
+    for _ in range(round(400 * growth)):
+        design = ''
+        target = round(rng.randint(40, 60) * growth)
+        while len(design) < target:
+            design += rng.choice(patterns)
+        if rng.random() < 0.2:
+            design += 'bb'
+        designs.append(design)
+    return ', '.join(patterns) + '\n\n' + '\n'.join(designs) + '\n', {}
+
+
+def gen_day20(rng, scale):
+    side = scaled_side(141, scale, odd=True)
+    maze = carve_maze(rng, side)
+    start, end = (side - 2, 1), (1, side - 2)
+
+    # Keep only the single route from S to E so the track has no branches
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        r, c = queue.popleft()
+        for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            nxt = (r + dr, c + dc)
+            if maze[nxt[0]][nxt[1]] == '.' and nxt not in parents:
+                parents[nxt] = (r, c)
+                queue.append(nxt)
+    grid = [['#'] * side for _ in range(side)]
+    cell = end
+    while cell is not None:
+        grid[cell[0]][cell[1]] = '.'
+        cell = parents[cell]
+    grid[start[0]][start[1]] = 'S'
+    grid[end[0]][end[1]] = 'E'
+    return grid_text(grid), {}
+
+
+def gen_day21(rng, scale):
+    codes = [f"{rng.randint(1, 9)}{rng.randint(0, 9)}{rng.randint(0, 9)}A" for _ in range(5 * scale)]
+    return '\n'.join(codes) + '\n', {}
+
+
+def gen_day22(rng, scale):
+    return '\n'.join(str(rng.randint(1, 16777215)) for _ in range(2000 * scale)) + '\n', {}
+
+
+def gen_day23(rng, scale):
+    count = 520 * scale
+    name_length = 2 if count <= 600 else 3
+    names = set()
+    while len(names) < count:
+        names.add(''.join(rng.choice(string.ascii_lowercase) for _ in range(name_length)))
+    names = sorted(names)
+
+    edges = set()
+    for name in names:
+        for other in rng.sample(names, 6):
+            if other != name:
+                edges.add(tuple(sorted((name, other))))
+    # Plant the LAN party: one 13-computer clique
+    clique = rng.sample(names, 13)
+    for i, a in enumerate(clique):
+        for b in clique[i + 1:]:
+            edges.add(tuple(sorted((a, b))))
+    edges = list(edges)
+    rng.shuffle(edges)
+    return '\n'.join(f"{a}-{b}" for a, b in edges) + '\n', {}
+
+
+def gen_day24(rng, scale):
+    bits = 45 * scale
+    used = set()
+
+    def new_wire():
+        while True:
+            name = ''.join(rng.choice('abcdefghijklmnopqrstuvw') for _ in range(3))
+            if name not in used:
+                used.add(name)
+                return name
+
+    x = [f"x{i:02d}" for i in range(bits)]
+    y = [f"y{i:02d}" for i in range(bits)]
+    z = [f"z{i:02d}" for i in range(bits + 1)]
+
+    # Ripple-carry adder; gates are lists so output wires can be swapped in place
+    gates = [[x[0], 'XOR', y[0], z[0]]]
+    carry = new_wire()
+    gates.append([x[0], 'AND', y[0], carry])
+    roles = []
+    for i in range(1, bits):
+        half_sum, half_carry, carry_and = new_wire(), new_wire(), new_wire()
+        carry_out = z[bits] if i == bits - 1 else new_wire()
+        sum_gate = [x[i], 'XOR', y[i], half_sum]
+        and_gate = [x[i], 'AND', y[i], half_carry]
+        z_gate = [half_sum, 'XOR', carry, z[i]]
+        gates.extend([sum_gate, and_gate, z_gate,
+                      [half_sum, 'AND', carry, carry_and],
+                      [half_carry, 'OR', carry_and, carry_out]])
+        roles.append((sum_gate, and_gate, z_gate, gates[-1]))
+        carry = carry_out
+
+    # Swap four output pairs the way the puzzle does
+    swapped = rng.sample(range(1, bits - 2), 4)
+    for bit in swapped[:3]:
+        _, _, z_gate, or_gate = roles[bit - 1]
+        z_gate[3], or_gate[3] = or_gate[3], z_gate[3]
+    sum_gate, and_gate, _, _ = roles[swapped[3] - 1]
+    sum_gate[3], and_gate[3] = and_gate[3], sum_gate[3]
+
+    lines = [f"{wire}: {rng.randint(0, 1)}" for wire in x + y]
+    lines.append('')
+    rng.shuffle(gates)
+    for a, op, b, out in gates:
+        if rng.random() < 0.5:
+            a, b = b, a
+        lines.append(f"{a} {op} {b} -> {out}")
+    return '\n'.join(lines) + '\n', {}
+
+
+def gen_day25(rng, scale):
+    schematics = []
+    for _ in range(500 * scale):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        if rng.random() < 0.5:
+            rows = ['#####'] + [''.join('#' if h >= level else '.' for h in heights)
+                                for level in range(1, 6)] + ['.....']
+        else:
+            rows = ['.....'] + [''.join('#' if h >= level else '.' for h in heights)
+                                for level in range(5, 0, -1)] + ['#####']
+        schematics.append('\n'.join(rows))
+    return '\n\n'.join(schematics) + '\n', {}
+
+
+GENERATORS = {
+    1: gen_day01, 2: gen_day02, 3: gen_day03, 4: gen_day04, 5: gen_day05,
+    6: gen_day06, 7: gen_day07, 8: gen_day08, 9: gen_day09, 10: gen_day10,
+    11: gen_day11, 12: gen_day12, 13: gen_day13, 14: gen_day14, 15: gen_day15,
+    16: gen_day16, 17: gen_day17, 18: gen_day18, 19: gen_day19, 20: gen_day20,
+    21: gen_day21, 22: gen_day22, 23: gen_day23, 24: gen_day24, 25: gen_day25,
+}
+
+
+def generate_input(day, scale, seed=2024):
+    """Return (text, params) for a synthetic day `day` input at `scale` x the real size."""
+    rng = random.Random(f"{seed}-{day}-{scale}")
+    return GENERATORS[day](rng, scale)
@@ -0,0 +1,48 @@
+"""Load dayNN/solution_*.py scripts as uniquely named modules."""
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_modules = {}
+
+
+def day_dir(day):
+    """Absolute path of the directory holding a day's files."""
+    return os.path.join(ROOT, f"day{day:02d}")
+
+
+def load_solution(day, script):
+    """Import dayNN/<script>.py once and return the module.
+
+    Every day uses the same file names, so each module is registered under a
+    unique name (day06_solution_part2).  The day directory is put on sys.path
+    while loading so sibling imports such as day 17's
+    `from solution_part1 import ...` keep working, and the bare sibling
+    names are dropped afterwards so the next day does not pick them up.
+    """
+    key = (day, script)
+    if key in _modules:
+        return _modules[key]
+
+    directory = day_dir(day)
+    path = os.path.join(directory, f"{script}.py")
+    name = f"day{day:02d}_{script}"
+
+    before = set(sys.modules)
+    sys.path.insert(0, directory)
+    try:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(directory)
+        for leaked in set(sys.modules) - before:
+            leaked_file = getattr(sys.modules[leaked], '__file__', None)
+            if leaked != name and leaked_file and os.path.dirname(os.path.abspath(leaked_file)) == directory:
+                del sys.modules[leaked]
+
+    _modules[key] = module
+    return module
@@ -0,0 +1,59 @@
+"""Fan solvers out over a process pool, longest job first."""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from runner.core import run_solver
+from runner.loader import ROOT
+from runner.registry import get_solver
+
+TIMINGS_FILE = os.path.join(ROOT, '.runner_timings.json')
+
+# Known CPU-heavy solvers, used to order the first run before any timings exist
+EXPENSIVE = ['day06/part2', 'day20/part2', 'day22/part2', 'day09/part2', 'day07/part2', 'day22/part1']
+
+
+def load_timings(path=TIMINGS_FILE):
+    """Wall times from the previous run keyed by solver key, or {} when there is none."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_timings(results, path=TIMINGS_FILE):
+    """Merge this run's wall times into the timings file, skipping cache hits."""
+    timings = load_timings(path)
+    for result in results:
+        if result.get('cached'):
+            continue
+        timings[f"day{result['day']:02d}/part{result['part']}"] = result['wall_time']
+    with open(path, 'w') as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+
+
+def schedule(solvers, timings):
+    """Order solvers longest-first by previous wall time, falling back to EXPENSIVE."""
+    def estimate(solver):
+        if solver.key in timings:
+            return timings[solver.key]
+        if solver.key in EXPENSIVE:
+            return float(len(EXPENSIVE) - EXPENSIVE.index(solver.key)) * 1e3
+        return 0.0
+    return sorted(solvers, key=estimate, reverse=True)
+
+
+def run_by_key(day, part, test, profile=None, cache=None, params=None):
+    """Process-pool entry point; solvers are looked up again inside the worker."""
+    return run_solver(get_solver(day, part), test=test, params=params, profile=profile, cache=cache)
+
+
+def run_parallel(solvers, jobs, test=False, timings=None, profile=None, cache=None, params=None):
+    """Run solvers on `jobs` worker processes and return results in the given order."""
+    timings = load_timings() if timings is None else timings
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for solver in schedule(solvers, timings):
+            futures[solver.key] = pool.submit(run_by_key, solver.day, solver.part, test, profile, cache, params)
+        return [futures[solver.key].result() for solver in solvers]
@@ -0,0 +1,76 @@
+"""cProfile output for solver runs: .pstats plus flamegraph-ready collapsed stacks.
+
+cProfile only records caller/callee edges, not whole stacks, so the collapsed
+file is rebuilt from the call graph: each function's own time is spread over
+the paths that reach it in proportion to the cumulative time of each edge.
+That is exact for tree-shaped call graphs and a close approximation otherwise,
+which is what flameprof and similar converters do as well.
+"""
+import os
+import pstats
+from collections import defaultdict
+
+from runner.loader import ROOT
+
+PROFILE_DIR = os.path.join(ROOT, 'profiles')
+
+# Paths contributing less than this many seconds are dropped from the folded output
+MIN_FOLDED_TIME = 1e-6
+
+
+def profile_name(solver):
+    return f"day{solver.day:02d}_part{solver.part}"
+
+
+def frame_label(func):
+    filename, lineno, name = func
+    if filename == '~':
+        # Built-ins have no file, the name already reads like "<built-in method ...>"
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{lineno})"
+    return label.replace(';', ',')
+
+
+def collapsed_stacks(stats):
+    """Fold a pstats call graph into {'root;child;leaf': seconds}."""
+    entries = stats.stats
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+
+    folded = defaultdict(float)
+
+    def walk(func, stack, on_stack, share):
+        own_time, cumulative = entries[func][2], entries[func][3]
+        stack = stack + (frame_label(func),)
+        folded[';'.join(stack)] += own_time * share
+        for callee, edge_time in callees[func].items():
+            if callee in on_stack or not entries[callee][3]:
+                continue
+            callee_share = share * edge_time / entries[callee][3]
+            if entries[callee][3] * callee_share >= MIN_FOLDED_TIME:
+                walk(callee, stack, on_stack | {callee}, callee_share)
+
+    for func, entry in entries.items():
+        if not entry[4]:
+            walk(func, (), {func}, 1.0)
+    return folded
+
+
+def write_profile(profiler, solver, directory=PROFILE_DIR):
+    """Write <dayNN_partN>.pstats and .collapsed for a finished profiler run."""
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, profile_name(solver))
+
+    profiler.dump_stats(base + '.pstats')
+
+    # Flamegraph tools expect integer sample counts, microseconds are used here
+    stats = pstats.Stats(profiler)
+    with open(base + '.collapsed', 'w') as f:
+        for stack, seconds in sorted(collapsed_stacks(stats).items()):
+            count = round(seconds * 1e6)
+            if count:
+                f.write(f"{stack} {count}\n")
+    return base + '.pstats', base + '.collapsed'
@@ -0,0 +1,329 @@
+"""Registry of every day/part solver and how to drive it.
+
+Each Solver splits a puzzle into a parse step and a solve step so the two can
+be timed separately.  Both steps receive the loaded solution module and the
+solver parameters (grid sizes, thresholds, blink counts, ...); the test
+variants of those parameters are used when running on the example files.
+"""
+from runner.loader import load_solution
+
+
+class Solver:
+    def __init__(self, day, part, entry, parse, solve, params=None, example_params=None,
+                 example='example.txt', script=None):
+        self.day = day
+        self.part = part
+        self.entry = entry
+        self.parse = parse
+        self.solve = solve
+        self.params = params or {}
+        self.example_params = example_params if example_params is not None else self.params
+        self.example = example
+        self.script = script or f"solution_part{part}"
+
+    @property
+    def key(self):
+        return f"day{self.day:02d}/part{self.part}"
+
+    def module(self):
+        return load_solution(self.day, self.script)
+
+    def get_params(self, test=False, overrides=None):
+        params = dict(self.example_params if test else self.params)
+        params.update(overrides or {})
+        return params
+
+    def __repr__(self):
+        return f"Solver({self.key}, {self.entry})"
+
+
+def parse_default(m, filename, params):
+    return m.parse_input(filename)
+
+
+# Day 1 ----------------------------------------------------------------------
+
+def solve_day01_part1(m, data, params):
+    left_list, right_list = data
+    return m.calculate_total_distance(left_list, right_list, params['engine'])
+
+def solve_day01_part2(m, data, params):
+    left_list, right_list = data
+    return m.calculate_similarity_score(left_list, right_list, params['engine'])
+
+
+# Day 2-5 --------------------------------------------------------------------
+
+def solve_day02_part1(m, reports, params):
+    return m.count_safe_reports(reports, params['engine'])
+
+def solve_day02_part2(m, reports, params):
+    return m.count_safe_reports_with_dampener(reports, params['method'], params['engine'])
+
+def solve_day03_part1(m, memory, params):
+    return m.calculate_total(m.find_valid_mul_instructions(memory, params['engine']))
+
+def solve_day03_part2(m, memory, params):
+    return m.process_instructions_with_conditionals(memory, params['engine'])
+
+def solve_day04_part1(m, grid, params):
+    return m.count_xmas(grid, params['engine'])
+
+def solve_day04_part2(m, grid, params):
+    return m.count_xmas_patterns(grid, params['engine'])
+
+def solve_day05_part1(m, data, params):
+    rules, updates = data
+    return m.solve_part1(rules, updates, params['validation'])
+
+def solve_day05_part2(m, data, params):
+    rules, updates = data
+    return m.solve_part2(rules, updates, params['method'])[0]
+
+
+# Day 6-10 -------------------------------------------------------------------
+
+def solve_day06_part1(m, data, params):
+    grid, start_pos = data
+    return len(m.simulate_guard_path(grid, start_pos, params['method']))
+
+def solve_day06_part2(m, data, params):
+    grid, start_pos = data
+    return len(m.solve_part2(grid, start_pos, params['method'], params['loop_start']))
+
+def solve_day07(m, equations, params):
+    return sum(test_value for test_value, numbers in equations
+               if m.can_be_solved(test_value, numbers))
+
+def solve_day08(m, data, params):
+    antennas, grid = data
+    return len(m.find_antinodes(antennas, grid))
+
+def solve_day09_part1(m, disk_map, params):
+    disk = m.build_disk(disk_map)
+    return m.calculate_checksum(m.defragment_disk(disk))
+
+def solve_day09_part2(m, disk_map, params):
+    disk, free_spans = m.build_disk(disk_map)
+    return m.calculate_checksum(m.defragment_whole_files(disk, free_spans))
+
+def solve_day10_part1(m, grid, params):
+    return sum(m.calculate_all_trailhead_scores(grid, m.find_trailheads(grid)))
+
+def solve_day10_part2(m, grid, params):
+    return sum(m.calculate_all_trailhead_ratings(grid, m.find_trailheads(grid)))
+
+
+# Day 11-15 ------------------------------------------------------------------
+
+def solve_day11_part1(m, stones, params):
+    return len(m.simulate_blinks(stones, params['blinks']))
+
+def solve_day11_part2(m, stones, params):
+    return m.simulate_blinks_optimized(stones, params['blinks'])
+
+def solve_day12(m, grid, params):
+    return sum(region['cost'] for region in m.find_all_regions(grid))
+
+def parse_day13(m, filename, params):
+    return m.parse_input(filename, params['offset']) if params['offset'] else m.parse_input(filename)
+
+def solve_day13(m, machines, params):
+    return m.solve_all_machines(machines)[1]
+
+def solve_day14_part1(m, robots, params):
+    width, height = params['width'], params['height']
+    final_robots = m.simulate_direct(robots, width, height, params['time_steps'])
+    return m.calculate_safety_factor(final_robots, width, height)
+
+def solve_day14_part2(m, robots, params):
+    return m.find_easter_egg_time(robots, params['width'], params['height'])
+
+def solve_day15_part1(m, data, params):
+    grid, moves = data
+    m.simulate_warehouse(grid, moves, grid.find('@'))
+    return m.calculate_gps_sum(grid)
+
+def solve_day15_part2(m, data, params):
+    original_grid, moves = data
+    grid = m.scale_grid(original_grid)
+    m.simulate_wide_warehouse(grid, moves, grid.find('@'))
+    return m.calculate_wide_gps_sum(grid)
+
+
+# Day 16-20 ------------------------------------------------------------------
+
+def solve_day16_part1(m, data, params):
+    grid, start_pos, end_pos = data
+    return m.dijkstra(grid, start_pos, end_pos)
+
+def solve_day16_part2(m, data, params):
+    grid, start_pos, end_pos = data
+    _, end_states, parents = m.dijkstra_all_paths(grid, start_pos, end_pos)
+    return len(m.find_optimal_tiles(end_states, parents))
+
+def solve_day17_part1(m, data, params):
+    registers, program = data
+    return ','.join(map(str, m.run_program(registers, program)))
+
+def solve_day17_part2(m, data, params):
+    registers, program = data
+    return m.solve_with_backtracking(program)
+
+def solve_day18_part1(m, coordinates, params):
+    size = params['grid_size']
+    corrupted = set(coordinates[:params['num_bytes']])
+    return m.bfs_shortest_path(corrupted, (0, 0), (size - 1, size - 1), size)
+
+def solve_day18_part2(m, coordinates, params):
+    size = params['grid_size']
+    x, y = m.find_blocking_byte(coordinates, (0, 0), (size - 1, size - 1), size, params['num_bytes'])
+    return f"{x},{y}"
+
+def solve_day19_part1(m, data, params):
+    patterns, designs = data
+    return sum(1 for design in designs if m.can_form_dp(design, patterns))
+
+def solve_day19_part2(m, data, params):
+    patterns, designs = data
+    return sum(m.count_ways_dp(design, patterns) for design in designs)
+
+def solve_day20_part1(m, data, params):
+    grid, start_pos, end_pos = data
+    normal_path = m.find_normal_path(grid, start_pos, end_pos)
+    return len(m.find_cheats(grid, normal_path, params['threshold']))
+
+def solve_day20_part2(m, data, params):
+    grid, start_pos, end_pos = data
+    normal_path = m.find_normal_path(grid, start_pos, end_pos)
+    return len(m.find_cheats_part2(grid, normal_path, max_cheat_time=params['max_cheat_time'],
+                                   threshold=params['threshold']))
+
+
+# Day 21-25 ------------------------------------------------------------------
+
+def solve_day21(m, codes, params):
+    return sum(m.calculate_complexity(code, params['layers'])[0] for code in codes)
+
+def solve_day22_part1(m, initial_secrets, params):
+    return sum(m.generate_nth_secret(initial, 2000) for initial in initial_secrets)
+
+def solve_day22_part2(m, initial_secrets, params):
+    return m.find_best_pattern(initial_secrets)[1]
+
+def solve_day23_part1(m, graph, params):
+    return sum(1 for triangle in m.find_triangles(graph) if m.has_t_computer(triangle))
+
+def solve_day23_part2(m, graph, params):
+    return ','.join(sorted(m.find_largest_clique(graph)))
+
+def solve_day24_part1(m, data, params):
+    wires, gates = data
+    return m.get_z_output(m.simulate_gates(wires, gates))
+
+def solve_day24_part2(m, data, params):
+    wires, gates = data
+    swapped_pairs = m.analyze_full_adder_structure(gates)
+    return ','.join(sorted(wire for pair in swapped_pairs for wire in pair))
+
+def solve_day25(m, schematics, params):
+    return m.count_compatible_pairs(schematics)
+
+
+SOLVERS = [
+    Solver(1, 1, 'calculate_total_distance', parse_default, solve_day01_part1,
+           params={'engine': 'auto'}),
+    Solver(1, 2, 'calculate_similarity_score', parse_default, solve_day01_part2,
+           params={'engine': 'auto'}),
+    Solver(2, 1, 'count_safe_reports', parse_default, solve_day02_part1,
+           params={'engine': 'auto'}),
+    Solver(2, 2, 'count_safe_reports_with_dampener', parse_default, solve_day02_part2,
+           params={'method': 'linear', 'engine': 'auto'}),
+    Solver(3, 1, 'find_valid_mul_instructions', parse_default, solve_day03_part1,
+           params={'engine': 'regex'}),
+    Solver(3, 2, 'process_instructions_with_conditionals', parse_default, solve_day03_part2,
+           params={'engine': 'regex'}),
+    Solver(4, 1, 'count_xmas', parse_default, solve_day04_part1,
+           params={'engine': 'auto'}),
+    Solver(4, 2, 'count_xmas_patterns', parse_default, solve_day04_part2,
+           params={'engine': 'auto'}),
+    Solver(5, 1, 'solve_part1', parse_default, solve_day05_part1,
+           params={'validation': 'indexed'}),
+    Solver(5, 2, 'solve_part2', parse_default, solve_day05_part2,
+           params={'method': 'cmp'}),
+    Solver(6, 1, 'simulate_guard_path', parse_default, solve_day06_part1,
+           params={'method': 'jump'}),
+    Solver(6, 2, 'solve_part2', parse_default, solve_day06_part2,
+           params={'method': 'jump', 'loop_start': 'divergence'}),
+    Solver(7, 1, 'can_be_solved', parse_default, solve_day07),
+    Solver(7, 2, 'can_be_solved', parse_default, solve_day07),
+    Solver(8, 1, 'find_antinodes', parse_default, solve_day08),
+    Solver(8, 2, 'find_antinodes', parse_default, solve_day08),
+    Solver(9, 1, 'defragment_disk', parse_default, solve_day09_part1),
+    Solver(9, 2, 'defragment_whole_files', parse_default, solve_day09_part2),
+    Solver(10, 1, 'calculate_all_trailhead_scores', parse_default, solve_day10_part1),
+    Solver(10, 2, 'calculate_all_trailhead_ratings', parse_default, solve_day10_part2),
+    Solver(11, 1, 'simulate_blinks', parse_default, solve_day11_part1,
+           params={'blinks': 25}),
+    Solver(11, 2, 'simulate_blinks_optimized', parse_default, solve_day11_part2,
+           params={'blinks': 75}),
+    Solver(12, 1, 'find_all_regions', parse_default, solve_day12),
+    Solver(12, 2, 'find_all_regions', parse_default, solve_day12),
+    Solver(13, 1, 'solve_all_machines', parse_day13, solve_day13,
+           params={'offset': 0}),
+    Solver(13, 2, 'solve_all_machines', parse_day13, solve_day13,
+           params={'offset': 10000000000000}),
+    Solver(14, 1, 'simulate_direct', parse_default, solve_day14_part1,
+           params={'width': 101, 'height': 103, 'time_steps': 100},
+           example_params={'width': 11, 'height': 7, 'time_steps': 100}),
+    Solver(14, 2, 'find_easter_egg_time', parse_default, solve_day14_part2,
+           params={'width': 101, 'height': 103},
+           example_params={'width': 11, 'height': 7}),
+    Solver(15, 1, 'simulate_warehouse', parse_default, solve_day15_part1),
+    Solver(15, 2, 'simulate_wide_warehouse', parse_default, solve_day15_part2),
+    Solver(16, 1, 'dijkstra', parse_default, solve_day16_part1),
+    Solver(16, 2, 'dijkstra_all_paths', parse_default, solve_day16_part2),
+    Solver(17, 1, 'run_program', parse_default, solve_day17_part1),
+    Solver(17, 2, 'solve_with_backtracking', parse_default, solve_day17_part2,
+           example='example2.txt'),
+    Solver(18, 1, 'bfs_shortest_path', parse_default, solve_day18_part1,
+           params={'grid_size': 71, 'num_bytes': 1024},
+           example_params={'grid_size': 7, 'num_bytes': 12}),
+    Solver(18, 2, 'find_blocking_byte', parse_default, solve_day18_part2,
+           params={'grid_size': 71, 'num_bytes': 1024},
+           example_params={'grid_size': 7, 'num_bytes': 12}),
+    Solver(19, 1, 'can_form_dp', parse_default, solve_day19_part1),
+    Solver(19, 2, 'count_ways_dp', parse_default, solve_day19_part2),
+    Solver(20, 1, 'find_cheats', parse_default, solve_day20_part1,
+           params={'threshold': 100}, example_params={'threshold': 2}),
+    Solver(20, 2, 'find_cheats_part2', parse_default, solve_day20_part2,
+           params={'threshold': 100, 'max_cheat_time': 20},
+           example_params={'threshold': 50, 'max_cheat_time': 20}),
+    Solver(21, 1, 'calculate_complexity', parse_default, solve_day21,
+           params={'layers': 3}),
+    # Day 21's scripts are identical; loading part 1's for both parts lets them
+    # share one get_move_cost lru_cache, which only depends on keypad geometry
+    Solver(21, 2, 'calculate_complexity', parse_default, solve_day21,
+           params={'layers': 26}, script='solution_part1'),
+    Solver(22, 1, 'generate_nth_secret', parse_default, solve_day22_part1),
+    Solver(22, 2, 'find_best_pattern', parse_default, solve_day22_part2,
+           example='example2.txt'),
+    Solver(23, 1, 'find_triangles', parse_default, solve_day23_part1),
+    Solver(23, 2, 'find_largest_clique', parse_default, solve_day23_part2),
+    Solver(24, 1, 'simulate_gates', parse_default, solve_day24_part1),
+    Solver(24, 2, 'analyze_full_adder_structure', parse_default, solve_day24_part2),
+    Solver(25, 1, 'count_compatible_pairs', parse_default, solve_day25),
+]
+
+
+def select_solvers(days=None, parts=None):
+    """Solvers for the given days/parts (all of them when unspecified), in day order."""
+    return [solver for solver in SOLVERS
+            if (not days or solver.day in days) and (not parts or solver.part in parts)]
+
+
+def get_solver(day, part):
+    for solver in SOLVERS:
+        if solver.day == day and solver.part == part:
+            return solver
+    raise KeyError(f"No solver registered for day {day} part {part}")